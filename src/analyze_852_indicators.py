@@ -27,13 +27,36 @@ Version: 1.0
 
 import pandas as pd
 import json
+import os
+from functools import lru_cache
 import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from datetime import datetime
 from pathlib import Path
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
+# Optional: pcre2's JIT runs the note-detection alternations faster than the
+# re module. Without it (or with ANALYZE_852_NO_PCRE2 set) re is used.
+try:
+    import pcre2
+except ImportError:
+    pcre2 = None
+
+# Optional: python-calamine reads the input workbook many times faster than
+# openpyxl. pandas picks it up through engine='calamine'.
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_READ_ENGINE = None
+
 
 # =============================================================================
 # CUNY INSTITUTION CODES (for Primo source record links)
@@ -109,6 +132,13 @@ PRIMO_SCOPE_CODES = {
 # MARC 852 PARSING
 # =============================================================================
 
+# Indicator characters allowed at fixed offsets 3 and 4 (852_0, 852__, 852#4, etc.)
+_852_INDICATOR_CHARS = frozenset('_#0123456789')
+
+# Subfields ($$a, $$b, $$h, $$i, $$k, etc.)
+_RE_852_SUBFIELD = re.compile(r'\$\$([a-z0-9])\s*([^$]*)', re.IGNORECASE)
+
+
 def parse_852_marc(marc_field):
     """
     Parse 852 MARC field into components.
@@ -123,22 +153,24 @@ def parse_852_marc(marc_field):
     marc = str(marc_field)
     result = {'raw': marc, 'subfields': {}}
     
-    # Extract indicators (852_0, 852__, 852#4, etc.)
-    ind_match = re.match(r'^852([_#0-9])([_#0-9])', marc)
-    if ind_match:
-        ind1, ind2 = ind_match.groups()
+    # Extract indicators (852_0, 852__, 852#4, etc.). They sit at fixed
+    # offsets right after the tag, so no regex is needed.
+    if (marc.startswith('852') and len(marc) >= 5
+            and marc[3] in _852_INDICATOR_CHARS and marc[4] in _852_INDICATOR_CHARS):
+        ind1, ind2 = marc[3], marc[4]
         result['indicator1'] = ind1 if ind1 not in ['_', '#'] else ''
         result['indicator2'] = ind2 if ind2 not in ['_', '#'] else ''
     
-    # Extract subfields ($$a, $$b, $$h, $$i, $$k, etc.)
-    subfield_pattern = r'\$\$([a-z0-9])\s*([^$]*)'
-    for match in re.finditer(subfield_pattern, marc, re.IGNORECASE):
-        code = match.group(1).lower()
-        value = match.group(2).strip()
-        if code in result['subfields']:
-            result['subfields'][code] += ' ' + value
+    # Extract subfields ($$a, $$b, $$h, $$i, $$k, etc.). findall() hands
+    # back (code, value) tuples without building a match object per subfield.
+    subfields = result['subfields']
+    for code, value in _RE_852_SUBFIELD.findall(marc):
+        code = code.lower()
+        value = value.strip()
+        if code in subfields:
+            subfields[code] += ' ' + value
         else:
-            result['subfields'][code] = value
+            subfields[code] = value
     
     return result
 
@@ -151,9 +183,7 @@ def _looks_like_shelving_control(value):
     Examples that ARE shelving control: DVD 521, CD 1811, Video disc 110
     Examples that are NOT (miscoded cutters): .A85, M53, R74
     """
-    if _RE_SHELVING_CTRL_AV.match(value.strip()):
-        return True
-    return False
+    return _RE_SHELVING_CTRL_AV.match(value.strip()) is not None
 
 
 def get_call_number_from_marc(parsed_marc):
@@ -176,11 +206,9 @@ def get_call_number_from_marc(parsed_marc):
     if not parsed_marc:
         return None, False, False, False
 
-    subfields = parsed_marc.get('subfields', {})
-
-    h = subfields.get('h', '')
-    i = subfields.get('i', '')
-    j = subfields.get('j', '')
+    # parse_852_marc always sets 'subfields'
+    subfields = parsed_marc['subfields']
+    h, i, j = subfields.get('h', ''), subfields.get('i', ''), subfields.get('j', '')
 
     # Strip trailing period from $h for classification purposes.
     # A trailing period on $h (e.g., "PL955.") usually means the period
@@ -195,9 +223,7 @@ def get_call_number_from_marc(parsed_marc):
                 # $h has a classification and $j has a separate shelving
                 # control number — two schemes in one field. Classify
                 # from $h/$i only; flag the conflict.
-                if i:
-                    return f"{h} {i}".strip(), False, False, True
-                return h.strip(), False, False, True
+                return (h + ' ' + i).strip() if i else h.strip(), False, False, True
             # $j alongside $h/$i but $j doesn't look like a shelving
             # control number — likely a miscoded cutter.
             parts = [p for p in [h, i, j] if p]
@@ -205,9 +231,7 @@ def get_call_number_from_marc(parsed_marc):
         # $j only (no $h or $i) — standalone shelving control number
         return j.strip(), True, False, False
     elif h:
-        if i:
-            return f"{h} {i}".strip(), False, False, False
-        return h.strip(), False, False, False
+        return (h + ' ' + i).strip() if i else h.strip(), False, False, False
     elif i:
         # $i (item part/cutter) without $h (classification) — the class
         # number is missing. Return $i so it's visible in the output, but
@@ -229,7 +253,7 @@ def get_call_number_from_marc(parsed_marc):
 # - X is not used
 # - Y is SuDoc (Congressional)
 
-LC_VALID_CLASSES = {
+LC_VALID_CLASSES = frozenset({
     # A - General Works
     'A', 'AC', 'AE', 'AG', 'AI', 'AM', 'AN', 'AP', 'AS', 'AY', 'AZ',
     # B - Philosophy, Psychology, Religion
@@ -310,7 +334,7 @@ LC_VALID_CLASSES = {
     'V', 'VA', 'VB', 'VC', 'VD', 'VE', 'VF', 'VG', 'VK', 'VM',
     # Z - Bibliography, Library Science
     'Z', 'ZA',
-}
+})
 
 
 # =============================================================================
@@ -336,107 +360,115 @@ _EQUIPMENT_WORDS = {
     'clicker', 'eraser', 'whiteboard', 'easel', 'calculator',
 }
 
+# Note patterns are written in lower case and matched against the lower-cased
+# call number (see is_not_a_call_number), rather than compiled IGNORECASE.
+# That is only equivalent for ASCII: str.lower() can change the length or
+# word boundaries of other text ('İ' becomes 'i' plus a combining dot). So
+# only printable ASCII takes that path; anything else is searched with
+# IGNORECASE copies (see _RE_ANY_NOTE_IGNORECASE).
+
 # Public note patterns — patron-facing instructions that belong in $z
 _PUBLIC_NOTE_PATTERNS = [re.compile(p) for p in [
     # Patron instructions
-    r'(?i)ask\s+(at|for|librarian|staff)',
-    r'(?i)check\s+(with|at|below)',
-    r'(?i)inquire',
-    r'(?i)please\s+',
-    r'(?i)assistance',
-    r'(?i)circulation\s+desk',
-    r'(?i)microforms?\s+desk',
+    r'ask\s+(at|for|librarian|staff)',
+    r'check\s+(with|at|below)',
+    r'inquire',
+    r'please\s+',
+    r'assistance',
+    r'circulation\s+desk',
+    r'microforms?\s+desk',
 
     # Access/availability notes (patron-facing)
-    r'(?i)^access\s*(for|through|to|:)',
-    r'(?i)access[:.]',
-    r'(?i)available\s+(at|in|from|to|on)',
-    r'(?i)not\s+available',
-    r'(?i)users?\s+(only|must|can|may)',
-    r'(?i)(college|university|library)\s+users',
+    r'^access\s*(for|through|to|:)',
+    r'access[:.]',
+    r'available\s+(at|in|from|to|on)',
+    r'not\s+available',
+    r'users?\s+(only|must|can|may)',
+    r'(college|university|library)\s+users',
 
     # Shelving/location guidance for patrons
-    r'(?i)shelved\s+(with|in|at|by|under)',
-    r'(?i)filed\s+(under|with|in)',
-    r'(?i)located\s+(in|at)',
-    r'(?i)\bon\s+reserve',
-    r'(?i)reference\s+(only|desk|room)',
-    r'(?i)non-circulating',
-    r'(?i)in-library\s+use',
-    r'(?i)room\s+use\s+only',
-    r'(?i)does\s+not\s+circulate',
-    r'(?i)\brestricted\b',
-    r'(?i)permission\s+(required|needed)',
+    r'shelved\s+(with|in|at|by|under)',
+    r'filed\s+(under|with|in)',
+    r'located\s+(in|at)',
+    r'\bon\s+reserve',
+    r'reference\s+(only|desk|room)',
+    r'non-circulating',
+    r'in-library\s+use',
+    r'room\s+use\s+only',
+    r'does\s+not\s+circulate',
+    r'\brestricted\b',
+    r'permission\s+(required|needed)',
 
     # Electronic access
-    r'(?i)online\s+(access|only|version)',
-    r'(?i)electronic\s+(access|version)',
-    r'(?i)e-?resource',
-    r'(?i)\bdatabase\b',
-    r'(?i)website',
-    r'(?i)workstation',
-    r'(?i)^https?://',
-    r'(?i)^www\.',
+    r'online\s+(access|only|version)',
+    r'electronic\s+(access|version)',
+    r'e-?resource',
+    r'\bdatabase\b',
+    r'website',
+    r'workstation',
+    r'^https?://',
+    r'^www\.',
 
     # Browsing notes
-    r'(?i)current\s+issues',
+    r'current\s+issues',
 
     # Location/room references
-    r'(?i)reading\s+room',
-    r'(?i)\d+(st|nd|rd|th)\s+floor',
+    r'reading\s+room',
+    r'\d+(st|nd|rd|th)\s+floor',
 
     # Format + location notes (e.g., "Bound volumes: 3rd floor")
-    r'(?i)bound\s+volume',
+    r'bound\s+volume',
 
     # Loan period/circulation notes
-    r'(?i)\d+[- ]?(day|week|hour)\s+(loan|checkout|reserve)',
+    r'\d+[- ]?(day|week|hour)\s+(loan|checkout|reserve)',
 ]]
 
 # Staff note patterns — cataloging/processing notes that belong in $x
 _STAFF_NOTE_PATTERNS = [re.compile(p) for p in [
     # Cataloging notes
-    r'(?i)cataloged\s+(under|with|as|separately)',
-    r'(?i)classed\s+(with|in)',
-    r'(?i)search\s+under',
-    r'(?i)see\s+(also|librarian|reference|archivist)',
-    r'(?i)contact\s+',
-    r'(?i)request\s+(from|at|through)',
-    r'(?i)consult\s+',
-    r'(?i)bound\s+with',
-    r'(?i)use\s+copy\s+in',
-    r'(?i)keep\s+at',
-    r'(?i)kept\s+(on|at|in)',
-    r'(?i)stored\s+(off-?site|in)',
-    r'(?i)shelve\s+in\b',
-    r'(?i)library\s+copy',
-    r'(?i)scholarship',
-    r'(?i)order\s+(from|through)',
-    r'(?i)interlibrary\s+loan',
-    r'(?i)\bill\s+only',
+    r'cataloged\s+(under|with|as|separately)',
+    r'classed\s+(with|in)',
+    r'search\s+under',
+    r'see\s+(also|librarian|reference|archivist)',
+    r'contact\s+',
+    r'request\s+(from|at|through)',
+    r'consult\s+',
+    r'bound\s+with',
+    r'use\s+copy\s+in',
+    r'keep\s+at',
+    r'kept\s+(on|at|in)',
+    r'stored\s+(off-?site|in)',
+    r'shelve\s+in\b',
+    r'library\s+copy',
+    r'scholarship',
+    r'order\s+(from|through)',
+    r'interlibrary\s+loan',
+    r'\bill\s+only',
 
     # Status notes
-    r'(?i)^in\s+process',
-    r'(?i)superseded',
-    r'(?i)cancelled',
-    r'(?i)withdrawn',
-    r'(?i)\bmissing\b',
-    r'(?i)\blost\b',
-    r'(?i)damaged',
+    r'^in\s+process',
+    r'superseded',
+    r'cancelled',
+    r'withdrawn',
+    r'\bmissing\b',
+    r'\blost\b',
+    r'damaged',
 
     # Shelving instructions (staff-facing)
-    r'(?i)sort\s+by\s+',
-    r'(?i)separately\s+classed',
-    r'(?i)shelved\s+alphabetically',
+    r'sort\s+by\s+',
+    r'separately\s+classed',
+    r'shelved\s+alphabetically',
 
     # Volume/issue notation without call number
-    r'(?i)^\*\s*(vol|no\.?|v\.|issue|pt\.?|part)',
+    r'^\*\s*(vol|no\.?|v\.|issue|pt\.?|part)',
 
     # Encoding/placeholder patterns
-    r'(?i)^e-[a-z]{2}---',
-    r'(?i)^[a-z]-[a-z]{2}---',
+    r'^e-[a-z]{2}---',
+    r'^[a-z]-[a-z]{2}---',
 ]]
 
-_PUNCTUATION_ONLY_RE = re.compile(r'^[\?\.\-\_\*\#]+$')
+# Placeholder punctuation (e.g., "???", "---", "*")
+_PLACEHOLDER_PUNCTUATION = '?.-_*#'
 
 # Pre-compiled classification patterns (compiled once at import, not per call)
 _RE_DIGIT = re.compile(r'\d')
@@ -458,11 +490,16 @@ _RE_AV_MUSIC = re.compile(r'^Music\s+(CD|DVD)\s+', re.IGNORECASE)
 _RE_LOCAL_HYPHEN = re.compile(r'^[A-Z]{2,5}\s+\d{2,4}-\d+', re.IGNORECASE)
 _RE_LOCAL_PREFIX_NUM = re.compile(r'^[A-Z]{2,5}\s+\d{2,4}(\s|$)', re.IGNORECASE)
 
+# The class-letter, SuDoc, reserve-year and LC patterns below use possessive
+# quantifiers (++, *+, {m,n}+; Python 3.11+) wherever the next token can never
+# match what the quantifier gave back, e.g. \d{1,4}+ followed by \s or '.'.
+# The engine then fails at once instead of retrying shorter runs.
+
 # Class letter extraction
-_RE_CLASS_LETTERS = re.compile(r'^([A-Z]{1,3})\s*\d', re.IGNORECASE)
+_RE_CLASS_LETTERS = re.compile(r'^([A-Z]{1,3}+)\s*+\d', re.IGNORECASE)
 
 # SuDoc
-_RE_SUDOC = re.compile(r'^[A-Z]{1,4}\s*\d+\.[A-Z0-9\s/\-\.]+:', re.IGNORECASE)
+_RE_SUDOC = re.compile(r'^[A-Z]{1,4}+\s*+\d++\.[A-Z0-9\s/\-\.]++:', re.IGNORECASE)
 _RE_SUDOC_Y = re.compile(r'^Y\s*\d', re.IGNORECASE)
 
 # LC geographic cutter colon — colons in LC cutter notation for subordinate
@@ -470,7 +507,7 @@ _RE_SUDOC_Y = re.compile(r'^Y\s*\d', re.IGNORECASE)
 # Examples: G3424 .A35:2C3 (Canadian Forces Base at Aldershot, Nova Scotia),
 #           G1778 .P4:3C8 (Curitiba, Brazil)
 _RE_LC_CUTTER_COLON = re.compile(
-    r'^[A-Z]{1,3}\s*\d+\s*\.[A-Z]\d+:\d+[A-Z]\d+',
+    r'^[A-Z]{1,3}+\s*+\d++\s*+\.[A-Z]\d++:\d++[A-Z]\d+',
     re.IGNORECASE
 )
 
@@ -489,16 +526,21 @@ _RE_DEWEY_AUTHOR = re.compile(r'^(\d{3})\s+[A-Z][a-z]{1,4}\b')
 
 # Local reserve labels
 _RE_RESERVE_EDITION = re.compile(r'^[A-Za-z]+\s*\d{4}\s+\d+(st|nd|rd|th)\s+Ed', re.IGNORECASE)
-_RE_RESERVE_YEAR = re.compile(r'^[A-Z]{1,3}\s+\d{1,2}\s+\d{4}\s*$', re.IGNORECASE)
+_RE_RESERVE_YEAR = re.compile(r'^[A-Z]{1,3}+\s++\d{1,2}+\s++\d{4}\s*$', re.IGNORECASE)
 
 # LC classification
 _RE_LC_MLCS = re.compile(r'MLCS\s*\d{4}/', re.IGNORECASE)
-_RE_LC_CUTTER_ATTACHED = re.compile(r'^[A-Z]{1,3}\s*\d{1,4}\.[A-Z]\d*', re.IGNORECASE)
-_RE_LC_CUTTER_SPACE = re.compile(r'^[A-Z]{1,3}\s*\d{1,4}(\s*\.\d+)?\s+\.?[A-Z]\d*', re.IGNORECASE)
-_RE_LC_DATE_CUTTER = re.compile(r'^[A-Z]{1,3}\s*\d{1,4}\s+\d{4}\s+\.?[A-Z]\d*', re.IGNORECASE)
-_RE_LC_DECIMAL = re.compile(r'^[A-Z]{1,3}\s*\d{1,4}\s*\.\d+', re.IGNORECASE)
-_RE_LC_CUTTER_NOSEP = re.compile(r'^[A-Z]{1,3}\d{1,4}[A-Z]\d*', re.IGNORECASE)
-_RE_LC_SIMPLE = re.compile(r'^[A-Z]{1,3}\s*\d{1,4}(\s|$)', re.IGNORECASE)
+# Every LC form starts with class letters + optional space + 1-4 digits.
+# _RE_LC_HEAD matches that once; the variants differ only in what follows
+# (group 1 is the space, empty when the number is attached to the letters),
+# and are matched from head.end() — see _RE_LC_TAIL below.
+_RE_LC_HEAD = re.compile(r'^[A-Z]{1,3}+(\s*+)\d{1,4}+', re.IGNORECASE)
+_RE_LC_TAIL_CUTTER_ATTACHED = re.compile(r'\.[A-Z]\d*', re.IGNORECASE)
+_RE_LC_TAIL_CUTTER_SPACE = re.compile(r'(\s*\.\d+)?\s+\.?[A-Z]\d*', re.IGNORECASE)
+_RE_LC_TAIL_DATE_CUTTER = re.compile(r'\s++\d{4}\s++\.?[A-Z]\d*', re.IGNORECASE)
+_RE_LC_TAIL_DECIMAL = re.compile(r'\s*+\.\d+')
+_RE_LC_TAIL_CUTTER_NOSEP = re.compile(r'[A-Z]\d*', re.IGNORECASE)
+_RE_LC_TAIL_SIMPLE = re.compile(r'(\s|$)')
 
 # Catch-all AV and local patterns (in _classify_call_number)
 _RE_AV_TAIL = re.compile(r'^(DVD|VHS|CD|VID|TAPE|VIDEO)\s*\d', re.IGNORECASE)
@@ -509,6 +551,134 @@ _RE_LOCAL_ACCESSION = re.compile(r'^\d{4,}-\d+')
 _RE_LOCAL_NOTATION = re.compile(r'^[*#]')
 
 
+def _pattern_body(pattern):
+    """
+    Return a compiled pattern's source wrapped in a self-contained group that
+    keeps its IGNORECASE flag, for embedding in a combined alternation.
+    """
+    body = pattern.pattern
+    if pattern.flags & re.IGNORECASE:
+        return f'(?i:{body})'
+    return f'(?:{body})'
+
+
+def _compile_any(patterns):
+    """
+    Combine compiled patterns into one alternation so a string is scanned
+    once instead of once per pattern. .search() on the result matches if
+    any of the patterns would.
+
+    Uses non-capturing groups only. Capturing groups make the engine record
+    their positions at every offset it tries, which is over twice as slow.
+    """
+    return re.compile('|'.join(_pattern_body(p) for p in patterns))
+
+
+def _compile_rule_set(rules):
+    """
+    Combine an ordered list of (compiled pattern, result) rules into a single
+    regex when the caller needs to know WHICH rule matched.
+
+    Each pattern becomes a named branch (r0, r1, ...) in list order. Python's
+    regex engine tries alternation branches left to right, so with .match()
+    the branch named by m.lastgroup is the FIRST rule that matches — the
+    same answer as calling each pattern's .match() in turn.
+
+    Returns: (combined_pattern, results) where results maps branch name to
+    the rule's result.
+    """
+    branches = []
+    results = {}
+    for i, (pattern, result) in enumerate(rules):
+        name = f'r{i}'
+        branches.append(f'(?P<{name}>{_pattern_body(pattern)})')
+        results[name] = result
+    return re.compile('|'.join(branches)), results
+
+
+# AV shelving: format + number, not followed by an LC cutter ("CD 3960 .P9"
+# is LC class CD, not a disc). Used as the first rule in _RE_AV_ANCHORED.
+_RE_AV_SIMPLE_NOT_LC = re.compile(
+    rf'(?!{_RE_AV_LC_CHECK.pattern}){_RE_AV_SIMPLE.pattern}',
+    re.IGNORECASE
+)
+
+# Anchored AV shelving patterns, checked in one pass by is_av_shelving_number
+_RE_AV_ANCHORED = _compile_any([
+    _RE_AV_SIMPLE_NOT_LC,
+    _RE_AV_ROM,
+    _RE_AV_PREFIX_FORMAT,
+    _RE_AV_CASSETTE,
+    _RE_AV_FICHE,
+    _RE_AV_MICRO_FORMAT,
+    _RE_AV_MUSIC,
+])
+
+def _compile_note_search(patterns):
+    """
+    Combine note patterns with _compile_any(), JIT-compiled with pcre2 when
+    it is available. The notes are the only patterns searched across the
+    whole of every call number, so they are where the JIT pays off.
+
+    pcre2 and re only agree on \s, \w and \b for printable ASCII: pcre2
+    doesn't count \x1c-\x1f as whitespace, and treats letters followed by
+    a combining mark differently at word boundaries. is_not_a_call_number
+    only searches printable ASCII with these.
+    """
+    combined = _compile_any(patterns)
+    if pcre2 is not None and not os.environ.get('ANALYZE_852_NO_PCRE2'):
+        return pcre2.compile(combined.pattern, jit=True)
+    return combined
+
+
+# Note detection for is_not_a_call_number. Almost no call number is a
+# note, so one search over both lists rules both kinds out. Only a hit is
+# searched again, for public notes alone; public notes take precedence, so
+# a hit that isn't a public note is a staff note.
+_RE_ANY_NOTE = _compile_note_search(_PUBLIC_NOTE_PATTERNS + _STAFF_NOTE_PATTERNS)
+_RE_PUBLIC_NOTE = _compile_note_search(_PUBLIC_NOTE_PATTERNS)
+
+# The same searches for everything else (non-ASCII text or control
+# characters), matched case-insensitively against the original text with
+# re, as the patterns were before they were lower-cased. These values are
+# rare, so the speed of this path hardly matters.
+_RE_ANY_NOTE_IGNORECASE = re.compile(
+    _compile_any(_PUBLIC_NOTE_PATTERNS + _STAFF_NOTE_PATTERNS).pattern, re.IGNORECASE)
+_RE_PUBLIC_NOTE_IGNORECASE = re.compile(
+    _compile_any(_PUBLIC_NOTE_PATTERNS).pattern, re.IGNORECASE)
+
+# LC variants after _RE_LC_HEAD, in priority order. The no-separator cutter
+# form is not listed: it only applies when the head had no space, and it is
+# checked separately (a letter, so it can never overlap with the simple form).
+_RE_LC_TAIL, _LC_TAIL_RESULTS = _compile_rule_set([
+    # LC with attached cutter (no space between class number and cutter)
+    (_RE_LC_TAIL_CUTTER_ATTACHED, ('0', 'Library of Congress', 'High', 'LC with cutter')),
+    # LC with cutter (space between class number and cutter)
+    (_RE_LC_TAIL_CUTTER_SPACE, ('0', 'Library of Congress', 'High', 'LC with cutter')),
+    # LC with number + date + cutter
+    (_RE_LC_TAIL_DATE_CUTTER, ('0', 'Library of Congress', 'High', 'LC with date and cutter')),
+    # LC with decimal but no cutter
+    (_RE_LC_TAIL_DECIMAL, ('0', 'Library of Congress', 'Medium', 'LC class with decimal')),
+    # Simple LC (just class and number)
+    (_RE_LC_TAIL_SIMPLE, ('0', 'Library of Congress', 'Medium', 'LC class and number')),
+])
+
+# Fallback shelving rules at the end of _classify_call_number, in priority
+# order. Checked in one pass once no standard classification has matched.
+_RE_SHELVING_FALLBACK, _SHELVING_FALLBACK_RESULTS = _compile_rule_set([
+    # Other AV patterns
+    (_RE_AV_TAIL, ('4', 'Shelving control number', 'High', 'AV format shelving')),
+    (_RE_AV_CIRC, ('4', 'Shelving control number', 'High', 'AV circulation shelving')),
+    # Local schemes
+    (_RE_LOCAL_2DIGIT, ('4', 'Shelving control number', 'Medium', 'Local shelving (2-digit prefix)')),
+    (_RE_LOCAL_DATE, ('4', 'Shelving control number', 'High', 'Date-based shelving')),
+    (_RE_LOCAL_ACCESSION, ('4', 'Shelving control number', 'Medium', 'Accession number')),
+    # Local notation
+    (_RE_LOCAL_NOTATION, ('4', 'Shelving control number', 'Low', 'Local notation')),
+])
+
+
+@lru_cache(maxsize=1 << 17)
 def is_not_a_call_number(cn):
     """
     Detect notes, instructions, test data, and other non-call-number data
@@ -522,7 +692,11 @@ def is_not_a_call_number(cn):
         'test_data' — placeholder/test values
         None — appears to be a real call number
     """
-    cn_lower = cn.lower().strip()
+    # Lower-cased once here so the note patterns can run without
+    # IGNORECASE, which more than doubles their cost (printable ASCII
+    # only; see _PUBLIC_NOTE_PATTERNS)
+    cn_folded = cn.lower()
+    cn_lower = cn_folded.strip()
 
     # Exact match test/placeholder values
     if cn_lower in _TEST_VALUES:
@@ -536,25 +710,35 @@ def is_not_a_call_number(cn):
     # like "Logitech Headset" (no number = not a call number).
     # Items WITH identifiers ("Apple Mouse #5", "TOOLKIT#1") are shelving
     # control numbers and should fall through to normal classification.
-    if set(cn_lower.split()) & _EQUIPMENT_WORDS and not _RE_DIGIT.search(cn):
+    # isdisjoint() takes the word list as is, so no set is built per value,
+    # and the digit search only runs when an equipment word is present.
+    if not _EQUIPMENT_WORDS.isdisjoint(cn_lower.split()) and not _RE_DIGIT.search(cn):
         return 'equipment'
 
-    # Punctuation-only placeholders
-    if _PUNCTUATION_ONLY_RE.match(cn):
+    # Punctuation-only placeholders. lstrip() stops at the first other
+    # character, so this is cheaper than a regex for ordinary call numbers.
+    # One trailing newline is allowed, as the old ^[?.\-_*#]+$ pattern's $
+    # allowed it.
+    placeholder = cn[:-1] if cn.endswith('\n') else cn
+    if placeholder and not placeholder.lstrip(_PLACEHOLDER_PUNCTUATION):
         return 'test_data'
 
-    # Pattern-based detection — check public notes first, then staff notes
-    for pattern in _PUBLIC_NOTE_PATTERNS:
-        if pattern.search(cn):
-            return 'public_note'
+    # Pattern-based detection — one search for either kind of note, then a
+    # second for public notes, which take precedence over staff notes
+    if cn.isascii() and cn.isprintable():
+        any_note, public_note, note_text = _RE_ANY_NOTE, _RE_PUBLIC_NOTE, cn_folded
+    else:
+        any_note, public_note, note_text = _RE_ANY_NOTE_IGNORECASE, _RE_PUBLIC_NOTE_IGNORECASE, cn
+    if not any_note.search(note_text):
+        return None
 
-    for pattern in _STAFF_NOTE_PATTERNS:
-        if pattern.search(cn):
-            return 'staff_note'
+    if public_note.search(note_text):
+        return 'public_note'
 
-    return None
+    return 'staff_note'
 
 
+@lru_cache(maxsize=1 << 17)
 def is_av_shelving_number(cn):
     """
     Detect AV format shelving numbers.
@@ -571,56 +755,33 @@ def is_av_shelving_number(cn):
     Note: CD and DVD are also valid LC class letters, but LC call numbers
     have different structure (class + number + cutter, e.g., "CD921 .S65")
     """
-    # Pattern 1: Simple format + number (CD 1811, DVD 456, VHS-937, DVD-14)
-    # Allows space or hyphen between format and number.
-    # BUT NOT if followed by a cutter pattern (dot + letter), which means LC
-    # e.g., "CD 3960 .P9" is LC class CD (Diplomatics), not an AV disc
-    if _RE_AV_SIMPLE.match(cn):
-        # Check if it looks like LC (has a cutter after the number)
-        if not _RE_AV_LC_CHECK.match(cn):
-            return True
-
-    # Pattern 2: Format + ROM + number (CD ROM 003, DVD ROM 001)
-    if _RE_AV_ROM.match(cn):
-        return True
-
-    # Pattern 3: Collection prefix + format (+ optional ROM) + number
-    # Examples: "BRL CD ROM 071", "MUS DVD 015"
-    if _RE_AV_PREFIX_FORMAT.match(cn):
+    # Anchored patterns, checked in a single pass (see _RE_AV_ANCHORED):
+    # - Simple format + number (CD 1811, DVD 456, VHS-937, DVD-14). Allows
+    #   space or hyphen between format and number, BUT NOT if followed by a
+    #   cutter pattern (dot + letter), which means LC — e.g., "CD 3960 .P9"
+    #   is LC class CD (Diplomatics), not an AV disc
+    # - Format + ROM + number (CD ROM 003, DVD ROM 001)
+    # - Collection prefix + format (+ optional ROM) + number
+    #   ("BRL CD ROM 071", "MUS DVD 015")
+    # - VIDEO CASSETTE + number ("VIDEO CASSETTE 2199")
+    # - Fiche/microfiche + number ("Fiche 414", "Microcard 5067")
+    # - Microfilm + format code + number ("Microfilm MF 400")
+    # - Music CD/format + number, without standard prefix ("Music CD no.8")
+    if _RE_AV_ANCHORED.match(cn):
         return True
 
-    # Pattern 4: Video/Videotape + format/disc + number (with optional prefix)
+    # Video/Videotape + format/disc + number (with optional prefix)
     # Examples: "DSI Video CD 18", "CohenLib Video disc 110",
     #           "MusLib Video- disc MD56", "MusLib Video- recording MV74",
     #           "CohenLib Video- tape 440", "CohenLib Videotape 264"
     if _RE_AV_VIDEO.search(cn):
         return True
 
-    # Pattern 5: VIDEO CASSETTE + number
-    # Examples: "VIDEO CASSETTE 2199", "VIDEO CASSETTE 2198"
-    if _RE_AV_CASSETTE.match(cn):
-        return True
-
-    # Pattern 6: Fiche/microfiche + number
-    # Examples: "Fiche 414", "Microcard 5067"
-    if _RE_AV_FICHE.match(cn):
-        return True
-
-    # Pattern 7: Microfilm + format code + number
-    # Examples: "Microfilm MF 400"
-    if _RE_AV_MICRO_FORMAT.match(cn):
-        return True
-
-    # Pattern 8: Recording + accession code (with optional prefix)
+    # Recording + accession code (with optional prefix)
     # Examples: "MusLib Recording CD1116"
     if _RE_AV_RECORDING.search(cn):
         return True
 
-    # Pattern 9: Music CD/format + number (without standard prefix)
-    # Examples: "Music CD no.8", "CD Rhymes"
-    if _RE_AV_MUSIC.match(cn):
-        return True
-
     return False
 
 
@@ -657,7 +818,8 @@ def extract_class_letters(cn):
 
 def is_valid_lc_class(letters):
     """Check if letters are a valid LC classification."""
-    return bool(letters) and letters in LC_VALID_CLASSES
+    # None and '' are never members, so no separate emptiness check
+    return letters in LC_VALID_CLASSES
 
 
 def is_sudoc(cn):
@@ -678,7 +840,10 @@ def is_sudoc(cn):
     The function distinguishes these by checking whether the colon follows
     an LC cutter pattern (.LetterDigits:DigitsLetterDigits).
     """
-    if ':' not in cn:
+    # Both the SuDoc stem and the LC cutter-colon pattern below start with
+    # a letter, so a colon in anything else (dates, local notation, staff
+    # shorthand) can be rejected without running either regex.
+    if ':' not in cn or not cn[:1].isalpha():
         return False
 
     # Exclude LC geographic cutter colons — the colon is inside a cutter
@@ -708,6 +873,12 @@ def is_dewey(cn):
     
     Returns: (is_match, confidence, note) or (False, None, None)
     """
+    # Every Dewey form is 3 digits then a decimal point or whitespace, which
+    # plain string tests can check before any of the patterns below run.
+    # isdecimal() and isspace() are what the patterns' \d and \s match.
+    if len(cn) < 5 or not cn[:3].isdecimal() or not (cn[3] == '.' or cn[3].isspace()):
+        return False, None, None
+
     # 3 digits with decimal
     if _RE_DEWEY_DECIMAL.match(cn):
         return True, 'High', 'Dewey with decimal'
@@ -748,6 +919,21 @@ SHELVING_PREFIXES = [
     'FOLIO', 'SPEC', 'DOCS', 'JUV', 'PER', 'REF',
 ]
 
+# For the prefix-only check in categorize_call_number
+_SHELVING_PREFIX_SET = frozenset(SHELVING_PREFIXES)
+_SHELVING_PREFIX_MAX_LEN = max(len(prefix) for prefix in SHELVING_PREFIXES)
+
+# First letters of the prefixes, so strip_shelving_prefix can turn away most
+# call numbers (LC classes A, B, E, G, H, ..., digits, etc.) on one character
+_SHELVING_PREFIX_INITIALS = frozenset(prefix[0] for prefix in SHELVING_PREFIXES)
+
+# One anchored alternation over SHELVING_PREFIXES, so strip_shelving_prefix
+# makes a single match call instead of a startswith() per prefix.
+_RE_SHELVING_PREFIX = re.compile(
+    '^(' + '|'.join(re.escape(prefix) for prefix in SHELVING_PREFIXES) + ') ',
+    re.IGNORECASE
+)
+
 
 def strip_shelving_prefix(cn):
     """
@@ -767,12 +953,18 @@ def strip_shelving_prefix(cn):
         "REFERENCE QA76 .B3" → ("QA76 .B3", "REFERENCE")
         "Periodical QA76.73 .P98" → ("QA76.73 .P98", "PERIODICAL")
     """
-    cn_upper = cn.upper()
-    for prefix in SHELVING_PREFIXES:
-        if cn_upper.startswith(prefix + ' '):
-            rest = cn[len(prefix):].lstrip()
-            if rest:
-                return rest, prefix
+    if cn[:1].upper() not in _SHELVING_PREFIX_INITIALS:
+        return cn, None
+
+    # IGNORECASE also folds some non-ASCII letters ('İ' onto 'I'), so the
+    # match only counts when it upper-cases to one of the prefixes, as the
+    # startswith() comparison on cn.upper() did
+    match = _RE_SHELVING_PREFIX.match(cn)
+    if match:
+        prefix = match.group(1).upper()
+        rest = cn[match.end(1):].lstrip()
+        if rest and prefix in _SHELVING_PREFIX_SET:
+            return rest, prefix
     return cn, None
 
 
@@ -809,36 +1001,39 @@ def is_lac(cn):
 # CLASSIFICATION HELPER
 # =============================================================================
 
-def _classify_call_number(cn_stripped):
+def _classify_letter_led(cn_stripped):
     """
-    Classify a call number string (already stripped of any $k prefix).
+    Classify a call number that starts with a letter: SuDoc, NLM, LAC,
+    local reserve labels, LC, and local collection prefixes.
 
-    Returns (indicator, scheme, confidence, note) if a classification is
-    found, or None if the pattern is not recognized.
+    Returns (indicator, scheme, confidence, note), or None if none of these
+    schemes match.
     """
     # === SUDOC ===
     if is_sudoc(cn_stripped):
         return '3', 'Superintendent of Documents', 'High', 'SuDoc pattern (colon separator)'
 
-    # Y class is always SuDoc (Congressional), never LC
-    if _RE_SUDOC_Y.match(cn_stripped):
-        return '3', 'Superintendent of Documents', 'High', 'SuDoc Y class (Congressional)'
-
-    # === NLM ===
     class_letters = extract_class_letters(cn_stripped)
-    if class_letters and _RE_NLM_CLASS.match(class_letters):
-        if _RE_NLM_NUM.match(cn_stripped):
-            return '2', 'National Library of Medicine', 'High', 'NLM class (QS-QZ or W)'
-
-    # === LAC (Library and Archives Canada) ===
-    is_lac_match, conf, note = is_lac(cn_stripped)
-    if is_lac_match:
-        return '7', 'Library and Archives Canada', conf, note
-
-    # === DEWEY ===
-    is_dew, conf, note = is_dewey(cn_stripped)
-    if is_dew:
-        return '1', 'Dewey Decimal', conf, note
+    lc_class = is_valid_lc_class(class_letters)
+
+    # Y, the NLM classes (QS-QZ, W) and LAC's FC are not LC class letters,
+    # so a call number with valid LC letters — the bulk of most catalogs —
+    # can skip straight past these checks. PS is the one overlap: LC up to
+    # PS7999, LAC from PS8000.
+    if not lc_class or class_letters == 'PS':
+        # Y class is always SuDoc (Congressional), never LC
+        if _RE_SUDOC_Y.match(cn_stripped):
+            return '3', 'Superintendent of Documents', 'High', 'SuDoc Y class (Congressional)'
+
+        # === NLM ===
+        if class_letters and _RE_NLM_CLASS.match(class_letters):
+            if _RE_NLM_NUM.match(cn_stripped):
+                return '2', 'National Library of Medicine', 'High', 'NLM class (QS-QZ or W)'
+
+        # === LAC (Library and Archives Canada) ===
+        is_lac_match, conf, note = is_lac(cn_stripped)
+        if is_lac_match:
+            return '7', 'Library and Archives Canada', conf, note
 
     # === LOCAL RESERVE LABELS ===
     # Abbreviated title + year + edition (e.g., "Am 2014 4th Ed",
@@ -854,52 +1049,60 @@ def _classify_call_number(cn_stripped):
         return '8', 'Other scheme', 'Medium', 'Local shelving label (title abbreviation + year)'
 
     # === LC CLASSIFICATION ===
-    if class_letters and is_valid_lc_class(class_letters):
+    if lc_class:
         # CIP/preliminary LC (MLCS pattern)
         if _RE_LC_MLCS.search(cn_stripped):
             return '0', 'Library of Congress', 'Low', 'LC (CIP/preliminary — MLCS number)'
-        # LC with attached cutter (no space between class number and cutter)
-        if _RE_LC_CUTTER_ATTACHED.match(cn_stripped):
-            return '0', 'Library of Congress', 'High', 'LC with cutter'
-        # LC with cutter (space between class number and cutter)
-        if _RE_LC_CUTTER_SPACE.match(cn_stripped):
-            return '0', 'Library of Congress', 'High', 'LC with cutter'
-        # LC with number + date + cutter
-        if _RE_LC_DATE_CUTTER.match(cn_stripped):
-            return '0', 'Library of Congress', 'High', 'LC with date and cutter'
-        # LC with decimal but no cutter
-        if _RE_LC_DECIMAL.match(cn_stripped):
-            return '0', 'Library of Congress', 'Medium', 'LC class with decimal'
-        # LC with cutter directly attached (no dot, no space)
-        # e.g., PQ2402A3, M1510S3.8, PR3716F55L, N6953R4
-        if _RE_LC_CUTTER_NOSEP.match(cn_stripped):
-            return '0', 'Library of Congress', 'Medium', 'LC with cutter (no separator)'
-        # Simple LC (just class and number)
-        if _RE_LC_SIMPLE.match(cn_stripped):
-            return '0', 'Library of Congress', 'Medium', 'LC class and number'
+        # Class letters + number once, then the variant that follows it
+        head = _RE_LC_HEAD.match(cn_stripped)
+        if head:
+            tail = _RE_LC_TAIL.match(cn_stripped, head.end())
+            if tail:
+                return _LC_TAIL_RESULTS[tail.lastgroup]
+            # LC with cutter directly attached (no dot, no space)
+            # e.g., PQ2402A3, M1510S3.8, PR3716F55L, N6953R4
+            if not head.group(1) and _RE_LC_TAIL_CUTTER_NOSEP.match(cn_stripped, head.end()):
+                return '0', 'Library of Congress', 'Medium', 'LC with cutter (no separator)'
 
     # === LOCAL COLLECTION SCHEMES ===
     is_local, conf, note = is_local_collection_scheme(cn_stripped)
     if is_local:
         return '4', 'Shelving control number', conf, note
 
-    # === OTHER AV PATTERNS ===
-    if _RE_AV_TAIL.match(cn_stripped):
-        return '4', 'Shelving control number', 'High', 'AV format shelving'
-    if _RE_AV_CIRC.match(cn_stripped):
-        return '4', 'Shelving control number', 'High', 'AV circulation shelving'
+    return None
+
 
-    # === LOCAL SCHEMES ===
-    if _RE_LOCAL_2DIGIT.match(cn_stripped):
-        return '4', 'Shelving control number', 'Medium', 'Local shelving (2-digit prefix)'
-    if _RE_LOCAL_DATE.match(cn_stripped):
-        return '4', 'Shelving control number', 'High', 'Date-based shelving'
-    if _RE_LOCAL_ACCESSION.match(cn_stripped):
-        return '4', 'Shelving control number', 'Medium', 'Accession number'
+@lru_cache(maxsize=1 << 17)
+def _classify_call_number(cn_stripped):
+    """
+    Classify a call number string (already stripped of any $k prefix).
 
-    # === LOCAL NOTATION ===
-    if _RE_LOCAL_NOTATION.match(cn_stripped):
-        return '4', 'Shelving control number', 'Low', 'Local notation'
+    Returns (indicator, scheme, confidence, note) if a classification is
+    found, or None if the pattern is not recognized.
+
+    Cached, like is_not_a_call_number and is_av_shelving_number: all three
+    depend only on the string, while main() dedups on the $j flags as well,
+    so the same call number still reaches them once per flag combination.
+    """
+    # Dewey is the only standard scheme that starts with a digit, and all
+    # the others need a leading letter, so one character test skips the
+    # family of patterns that cannot apply.
+    first = cn_stripped[:1]
+    if first.isdigit():
+        # === DEWEY ===
+        is_dew, conf, note = is_dewey(cn_stripped)
+        if is_dew:
+            return '1', 'Dewey Decimal', conf, note
+    elif first.isalpha():
+        result = _classify_letter_led(cn_stripped)
+        if result:
+            return result
+
+    # === OTHER AV PATTERNS, LOCAL SCHEMES, LOCAL NOTATION ===
+    # Checked in one pass; the first rule in _RE_SHELVING_FALLBACK wins.
+    match = _RE_SHELVING_FALLBACK.match(cn_stripped)
+    if match:
+        return _SHELVING_FALLBACK_RESULTS[match.lastgroup]
 
     return None
 
@@ -974,12 +1177,13 @@ def categorize_call_number(call_num, from_j=False, j_combined=False,
     # === CHECK FOR PREFIX-ONLY CALL NUMBERS ===
     # Words like "Periodical", "Thesis", "Reference" are $k (call number
     # prefix) values. When they appear alone with no classification after
-    # them, the indicator is ambiguous.
-    if cn.upper().strip() in SHELVING_PREFIXES:
-        prefix_word = cn.strip()
+    # them, the indicator is ambiguous. cn is already stripped, and
+    # upper() never shortens a string, so anything longer than the longest
+    # prefix is skipped without building an upper-cased copy.
+    if len(cn) <= _SHELVING_PREFIX_MAX_LEN and cn.upper() in _SHELVING_PREFIX_SET:
         return ('8', 'Other scheme', 'Low',
                 "Prefix only — no classification follows. Could be shelving control (4) or other scheme (8)",
-                f"Move '{prefix_word}' to $k")
+                f"Move '{cn}' to $k")
 
     # === STRIP SHELVING PREFIXES ===
     # Try stripping $k prefixes (OVERSIZE, DOCS, PERIODICAL, THESIS, etc.)
@@ -1024,92 +1228,150 @@ def categorize_call_number(call_num, from_j=False, j_combined=False,
     return indicator, scheme, conf, note, '; '.join(subfield_changes)
 
 
+# Below this many distinct call numbers, classifying in-process is faster
+# than starting worker processes.
+_PARALLEL_MIN_KEYS = 20000
+
+
+def _categorize_key(key):
+    """Classify one (call number, from $j, $j combined, $j conflict) key."""
+    cn, from_j, j_combined, j_conflict = key
+    return categorize_call_number(cn, from_j=from_j, j_combined=j_combined,
+                                  j_conflict=j_conflict)
+
+
+def _categorize_keys(keys):
+    """
+    Classify a list of distinct keys, spread across worker processes when
+    there are enough of them to pay for starting the pool.
+
+    Returns results in the same order as keys.
+    """
+    # CPUs this process may run on. os.cpu_count() reports the whole host,
+    # which in a container or under taskset can be far more than that.
+    if hasattr(os, 'sched_getaffinity'):
+        workers = len(os.sched_getaffinity(0))
+    else:
+        workers = os.cpu_count() or 1
+    if workers < 2 or len(keys) < _PARALLEL_MIN_KEYS:
+        return [_categorize_key(key) for key in keys]
+
+    # A few chunks per worker keeps them evenly loaded without paying the
+    # inter-process round trip for every call number.
+    chunksize = max(1000, len(keys) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_categorize_key, keys, chunksize=chunksize))
+
+
 # =============================================================================
 # EXCEL OUTPUT
 # =============================================================================
 
+# Shared styles, created once and reused by reference for every cell
+_DATA_FONT = Font(name='Arial', size=12)
+_BOLD_FONT = Font(name='Arial', size=12, bold=True)
+_ITALIC_FONT = Font(name='Arial', size=12, italic=True)
+_TITLE_FONT = Font(name='Arial', size=14, bold=True)
+_HEADER_FONT = Font(name='Arial', size=12, bold=True, color='FFFFFF')
+_HEADER_FILL = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+_HEADER_ALIGNMENT = Alignment(horizontal='center', wrap_text=True)
+_THIN_BORDER = Border(
+    left=Side(style='thin'), right=Side(style='thin'),
+    top=Side(style='thin'), bottom=Side(style='thin')
+)
+_GREEN_FILL = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+_YELLOW_FILL = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
+_RED_FILL = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+_NOT_CN_FILL = PatternFill(start_color='FF6B6B', end_color='FF6B6B', fill_type='solid')
+_CONF_FILLS = {'High': _GREEN_FILL, 'Medium': _YELLOW_FILL, 'Low': _RED_FILL}
+_CHANGE_FILLS = {'Yes': _RED_FILL, 'No': _GREEN_FILL, 'Review': _YELLOW_FILL}
+
+
+def _cell(ws, value, font=_DATA_FONT, fill=None, border=None, number_format=None):
+    """Create a styled cell for appending to a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _style_template(ws, font=_DATA_FONT, fill=None, border=None, number_format=None):
+    """
+    Resolve a combination of cell styles against the workbook once, for
+    stamping onto many cells with _styled_cell().
+
+    Assigning Font/Fill/Border objects to a cell makes openpyxl hash them
+    into the workbook's style tables every time; the resolved style is a
+    small array of table indexes that can simply be copied.
+
+    cell._style is an openpyxl internal, not public API, which is why the
+    README pins openpyxl to 3.1.x.
+    """
+    return _cell(ws, None, font=font, fill=fill, border=border,
+                 number_format=number_format)._style
+
+
+def _styled_cell(ws, value, style):
+    """Create a write-only cell carrying a style from _style_template()."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell._style = copy(style)
+    return cell
+
+
+def _header_row(ws, headers):
+    """Build a row of table header cells (blue fill, white bold text)."""
+    return [_cell(ws, h, font=_HEADER_FONT, fill=_HEADER_FILL, border=_THIN_BORDER)
+            for h in headers]
+
+
+# Columns of the main data sheet, in order. Also the columns written by
+# create_columnar_output().
+_OUTPUT_COLUMNS = [
+    'Permanent Call Number', 'Extracted Call Number', 'Permanent Call Number Type',
+    '852 MARC', 'Normalized Call Number', 'Institution Name', 'Library Name',
+    'MMS Id', 'Holdings ID', 'Suppressed',
+    'Current Indicator', 'Suggested Indicator', 'Change Needed',
+    'Classification Type', 'Confidence', 'Subfield Changes', 'Notes'
+]
+
+# Output columns with only a handful of distinct values (up to a few hundred
+# for Notes), whatever the number of records
+_INTERNED_COLUMNS = frozenset([
+    'Permanent Call Number Type', 'Institution Name', 'Library Name', 'Suppressed',
+    'Current Indicator', 'Suggested Indicator', 'Change Needed',
+    'Classification Type', 'Confidence', 'Subfield Changes', 'Notes',
+])
+
+
 def create_excel_output(df, output_path):
-    """Create formatted Excel workbook with analysis results."""
-    
-    wb = Workbook()
-
-    # Styles
-    data_font = Font(name='Arial', size=12)
-    header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-    header_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
-    conf_colors = {
-        'High': PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'),
-        'Medium': PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid'),
-        'Low': PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-    }
-    not_cn_fill = PatternFill(start_color='FF6B6B', end_color='FF6B6B', fill_type='solid')
+    """
+    Create formatted Excel workbook with analysis results.
+
+    The workbook is written in openpyxl's write-only mode: rows are streamed
+    to disk as they are appended instead of being held as a full grid of
+    cell objects, so memory stays flat as the number of records grows.
+    Column widths and frozen panes must be set before the first append.
+    """
     
+    wb = Workbook(write_only=True)
+
     # === SHEET 1: Main data ===
-    ws_data = wb.active
-    ws_data.title = "852 Field Analysis"
+    ws_data = wb.create_sheet("852 Field Analysis")
 
     # Force ID columns to string to prevent scientific notation
     for col in ['MMS Id', 'Holdings ID']:
         if col in df.columns:
             df[col] = df[col].astype(str)
 
-    change_yes_fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-    change_no_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-    change_review_fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-
     # ID columns (MMS Id = 8, Holdings ID = 9) — stored as text
     id_col_indices = {8, 9}
 
-    headers = [
-        'Permanent Call Number', 'Extracted Call Number', 'Permanent Call Number Type',
-        '852 MARC', 'Normalized Call Number', 'Institution Name', 'Library Name',
-        'MMS Id', 'Holdings ID', 'Suppressed',
-        'Current Indicator', 'Suggested Indicator', 'Change Needed',
-        'Classification Type', 'Confidence', 'Subfield Changes', 'Notes'
-    ]
-
-    for col, header in enumerate(headers, 1):
-        cell = ws_data.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center', wrap_text=True)
-        cell.border = thin_border
-
-    for excel_row, (_, row) in enumerate(df.iterrows(), 2):
-        data = [
-            row['Permanent Call Number'], row['Extracted Call Number'],
-            row['Permanent Call Number Type'], row['852 MARC'],
-            row['Normalized Call Number'], row['Institution Name'], row['Library Name'],
-            row['MMS Id'], row['Holdings ID'], row['Suppressed'],
-            row['Current Indicator'], row['Suggested Indicator'], row['Change Needed'],
-            row['Classification Type'], row['Confidence'],
-            row['Subfield Changes'], row['Notes']
-        ]
-        for col_idx, value in enumerate(data, 1):
-            cell = ws_data.cell(row=excel_row, column=col_idx, value=value)
-            cell.font = data_font
-            cell.border = thin_border
-            if col_idx in id_col_indices:
-                cell.number_format = '@'
-            # Change Needed column coloring (column 13)
-            if col_idx == 13:
-                if value == 'Yes':
-                    cell.fill = change_yes_fill
-                elif value == 'No':
-                    cell.fill = change_no_fill
-                elif value == 'Review':
-                    cell.fill = change_review_fill
-            # Confidence column coloring (column 15)
-            if col_idx == 15 and value in conf_colors:
-                cell.fill = conf_colors[value]
-            # Not a call number highlighting (column 14)
-            if col_idx == 14 and value == 'Not a call number':
-                cell.fill = not_cn_fill
-                cell.font = Font(name='Arial', size=12, bold=True)
+    headers = _OUTPUT_COLUMNS
 
     col_widths = {
         'A': 35, 'B': 30, 'C': 25, 'D': 60, 'E': 45,
@@ -1122,9 +1384,61 @@ def create_excel_output(df, output_path):
 
     ws_data.freeze_panes = 'A2'
     ws_data.auto_filter.ref = f"A1:Q{len(df) + 1}"
+
+    header_cells = _header_row(ws_data, headers)
+    for cell in header_cells:
+        cell.alignment = _HEADER_ALIGNMENT
+    ws_data.append(header_cells)
+
+    # Every data cell gets one of these styles, resolved once up front.
+    # column_styles is the per-column default, indexed from 0.
+    data_style = _style_template(ws_data, border=_THIN_BORDER)
+    id_style = _style_template(ws_data, border=_THIN_BORDER, number_format='@')
+    column_styles = [id_style if col_idx in id_col_indices else data_style
+                     for col_idx in range(1, len(headers) + 1)]
+    change_styles = {value: _style_template(ws_data, fill=fill, border=_THIN_BORDER)
+                     for value, fill in _CHANGE_FILLS.items()}
+    conf_styles = {value: _style_template(ws_data, fill=fill, border=_THIN_BORDER)
+                   for value, fill in _CONF_FILLS.items()}
+    not_cn_style = _style_template(ws_data, font=_BOLD_FONT, fill=_NOT_CN_FILL,
+                                   border=_THIN_BORDER)
+
+    # The headers are the DataFrame column names, so each row's values come
+    # straight from zipping those columns, without building a Series per row
+    # as iterrows() does. Each column is pulled out with tolist() first:
+    # iterating a Series hands values out one at a time, which is slow for
+    # Arrow-backed strings. Values in the low-cardinality columns are
+    # interned, so rows share one string object per distinct value instead
+    # of each holding its own copy.
+    columns = []
+    for col in headers:
+        values = df[col].tolist()
+        if col in _INTERNED_COLUMNS:
+            values = [sys.intern(v) if type(v) is str else v for v in values]
+        columns.append(values)
+
+    for data in zip(*columns):
+        # Only three columns are colored by value; pick their styles once
+        # per row instead of testing the column number for every cell
+        styles = column_styles.copy()
+        # Change Needed column coloring (column 13)
+        if data[12] in change_styles:
+            styles[12] = change_styles[data[12]]
+        # Not a call number highlighting (column 14)
+        if data[13] == 'Not a call number':
+            styles[13] = not_cn_style
+        # Confidence column coloring (column 15)
+        if data[14] in conf_styles:
+            styles[14] = conf_styles[data[14]]
+        ws_data.append([_styled_cell(ws_data, value, style)
+                        for value, style in zip(data, styles)])
     
     # === SHEET 2: Statistics ===
     ws_stats = wb.create_sheet("Statistics")
+    ws_stats.column_dimensions['A'].width = 50
+    ws_stats.column_dimensions['B'].width = 30
+    ws_stats.column_dimensions['C'].width = 15
+    ws_stats.column_dimensions['D'].width = 12
     
     summary_indicator = df.groupby(['Suggested Indicator', 'Classification Type']).size().reset_index(name='Count')
     summary_indicator['Percentage'] = (summary_indicator['Count'] / len(df) * 100).round(2)
@@ -1136,155 +1450,113 @@ def create_excel_output(df, output_path):
     summary_institution = df.groupby('Institution Name').size().reset_index(name='Count')
     summary_institution = summary_institution.sort_values('Count', ascending=False)
     
-    row = 1
-    ws_stats.cell(row=row, column=1, value="852 First Indicator Analysis - Statistics")
-    ws_stats.cell(row=row, column=1).font = Font(name='Arial', size=14, bold=True)
-    row += 2
-    
-    ws_stats.cell(row=row, column=1, value="Overall Summary")
-    ws_stats.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
-    ws_stats.cell(row=row, column=1, value="Total Records:").font = data_font
-    ws_stats.cell(row=row, column=2, value=len(df)).font = data_font
-    row += 1
-    ws_stats.cell(row=row, column=1, value="Records with Extracted Call Number:").font = data_font
-    ws_stats.cell(row=row, column=2, value=df['Extracted Call Number'].notna().sum()).font = data_font
-    row += 2
-    
-    ws_stats.cell(row=row, column=1, value="By Classification Type")
-    ws_stats.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
-    
-    for col_idx, header in enumerate(['Suggested Indicator', 'Classification Type', 'Count', 'Percentage'], 1):
-        cell = ws_stats.cell(row=row, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = thin_border
-    row += 1
+    ws_stats.append([_cell(ws_stats, "852 First Indicator Analysis - Statistics", font=_TITLE_FONT)])
+    ws_stats.append([])
     
-    for _, data_row in summary_indicator.iterrows():
-        for col_idx, val in enumerate([data_row['Suggested Indicator'],
-                                       data_row['Classification Type'],
-                                       data_row['Count']], 1):
-            c = ws_stats.cell(row=row, column=col_idx, value=val)
-            c.font = data_font
-            c.border = thin_border
-        cell = ws_stats.cell(row=row, column=4, value=data_row['Percentage'] / 100)
-        cell.number_format = '0.00%'
-        cell.font = data_font
-        cell.border = thin_border
-        row += 1
-    row += 1
+    ws_stats.append([_cell(ws_stats, "Overall Summary", font=_BOLD_FONT)])
+    ws_stats.append([_cell(ws_stats, "Total Records:"), _cell(ws_stats, len(df))])
+    ws_stats.append([_cell(ws_stats, "Records with Extracted Call Number:"),
+                     _cell(ws_stats, df['Extracted Call Number'].notna().sum())])
+    ws_stats.append([])
     
-    ws_stats.cell(row=row, column=1, value="By Confidence Level")
-    ws_stats.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
+    ws_stats.append([_cell(ws_stats, "By Classification Type", font=_BOLD_FONT)])
+    ws_stats.append(_header_row(ws_stats, ['Suggested Indicator', 'Classification Type', 'Count', 'Percentage']))
     
-    for col_idx, header in enumerate(['Confidence', 'Count', 'Percentage'], 1):
-        cell = ws_stats.cell(row=row, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = thin_border
-    row += 1
+    for indicator, class_type, count, pct in summary_indicator.itertuples(index=False, name=None):
+        ws_stats.append([
+            _cell(ws_stats, indicator, border=_THIN_BORDER),
+            _cell(ws_stats, class_type, border=_THIN_BORDER),
+            _cell(ws_stats, count, border=_THIN_BORDER),
+            _cell(ws_stats, pct / 100, border=_THIN_BORDER, number_format='0.00%'),
+        ])
+    ws_stats.append([])
     
-    for _, data_row in summary_confidence.iterrows():
-        cell1 = ws_stats.cell(row=row, column=1, value=data_row['Confidence'])
-        cell1.font = data_font
-        cell1.border = thin_border
-        if data_row['Confidence'] in conf_colors:
-            cell1.fill = conf_colors[data_row['Confidence']]
-        c2 = ws_stats.cell(row=row, column=2, value=data_row['Count'])
-        c2.font = data_font
-        c2.border = thin_border
-        cell = ws_stats.cell(row=row, column=3, value=data_row['Percentage'] / 100)
-        cell.number_format = '0.00%'
-        cell.font = data_font
-        cell.border = thin_border
-        row += 1
-    row += 1
+    ws_stats.append([_cell(ws_stats, "By Confidence Level", font=_BOLD_FONT)])
+    ws_stats.append(_header_row(ws_stats, ['Confidence', 'Count', 'Percentage']))
     
-    ws_stats.cell(row=row, column=1, value="By Institution")
-    ws_stats.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
+    for confidence, count, pct in summary_confidence.itertuples(index=False, name=None):
+        ws_stats.append([
+            _cell(ws_stats, confidence, border=_THIN_BORDER, fill=_CONF_FILLS.get(confidence)),
+            _cell(ws_stats, count, border=_THIN_BORDER),
+            _cell(ws_stats, pct / 100, border=_THIN_BORDER, number_format='0.00%'),
+        ])
+    ws_stats.append([])
     
-    for col_idx, header in enumerate(['Institution', 'Count'], 1):
-        cell = ws_stats.cell(row=row, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = thin_border
-    row += 1
+    ws_stats.append([_cell(ws_stats, "By Institution", font=_BOLD_FONT)])
+    ws_stats.append(_header_row(ws_stats, ['Institution', 'Count']))
     
-    for _, data_row in summary_institution.iterrows():
-        c1 = ws_stats.cell(row=row, column=1, value=data_row['Institution Name'])
-        c1.font = data_font
-        c1.border = thin_border
-        c2 = ws_stats.cell(row=row, column=2, value=data_row['Count'])
-        c2.font = data_font
-        c2.border = thin_border
-        row += 1
-    
-    ws_stats.column_dimensions['A'].width = 50
-    ws_stats.column_dimensions['B'].width = 30
-    ws_stats.column_dimensions['C'].width = 15
-    ws_stats.column_dimensions['D'].width = 12
+    for inst, count in summary_institution.itertuples(index=False, name=None):
+        ws_stats.append([
+            _cell(ws_stats, inst, border=_THIN_BORDER),
+            _cell(ws_stats, count, border=_THIN_BORDER),
+        ])
     
     # === SHEET 3: By Institution ===
     ws_inst = wb.create_sheet("By Institution")
+    ws_inst.column_dimensions['A'].width = 50
+    ws_inst.column_dimensions['B'].width = 40
+    for col in 'CDEFGHIJKLMNO':
+        ws_inst.column_dimensions[col].width = 10
     
     crosstab = pd.crosstab(df['Institution Name'], df['Suggested Indicator'], margins=True, dropna=False)
     
-    ws_inst.cell(row=1, column=1, value="Classification by Institution")
-    ws_inst.cell(row=1, column=1).font = Font(name='Arial', size=14, bold=True)
-    
-    row = 3
-    ws_inst.cell(row=row, column=1, value="Count by Institution and Suggested Indicator")
-    ws_inst.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
+    ws_inst.append([_cell(ws_inst, "Classification by Institution", font=_TITLE_FONT)])
+    ws_inst.append([])
+    ws_inst.append([_cell(ws_inst, "Count by Institution and Suggested Indicator", font=_BOLD_FONT)])
     
     headers = ['Institution'] + [str(c) for c in crosstab.columns]
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws_inst.cell(row=row, column=col_idx, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = thin_border
-    row += 1
+    ws_inst.append(_header_row(ws_inst, headers))
     
-    for inst in crosstab.index:
-        c = ws_inst.cell(row=row, column=1, value=inst)
-        c.font = data_font
-        c.border = thin_border
-        for col_idx, ind in enumerate(crosstab.columns, 2):
-            c = ws_inst.cell(row=row, column=col_idx, value=int(crosstab.loc[inst, ind]))
-            c.font = data_font
-            c.border = thin_border
-        row += 1
+    # One row list per institution instead of a .loc lookup per cell
+    for inst, counts in zip(crosstab.index, crosstab.to_numpy().tolist()):
+        cells = [_cell(ws_inst, inst, border=_THIN_BORDER)]
+        cells.extend(_cell(ws_inst, count, border=_THIN_BORDER) for count in counts)
+        ws_inst.append(cells)
     
-    row += 2
-    ws_inst.cell(row=row, column=1, value="Sample 'Other Scheme' and 'Unknown' Entries by Institution")
-    ws_inst.cell(row=row, column=1).font = Font(name='Arial', size=12, bold=True)
-    row += 1
-    ws_inst.cell(row=row, column=1, value="(These may be local schemes that vary by campus)")
-    ws_inst.cell(row=row, column=1).font = Font(name='Arial', size=12, italic=True)
-    row += 2
+    ws_inst.append([])
+    ws_inst.append([])
+    ws_inst.append([_cell(ws_inst, "Sample 'Other Scheme' and 'Unknown' Entries by Institution", font=_BOLD_FONT)])
+    ws_inst.append([_cell(ws_inst, "(These may be local schemes that vary by campus)", font=_ITALIC_FONT)])
+    ws_inst.append([])
     
     other_unknown = df[df['Suggested Indicator'].isin(['8', 'blank', 'N/A'])]
     for inst in other_unknown['Institution Name'].value_counts().head(10).index:
-        ws_inst.cell(row=row, column=1, value=inst).font = Font(name='Arial', size=12, bold=True)
-        row += 1
+        ws_inst.append([_cell(ws_inst, inst, font=_BOLD_FONT)])
         samples = other_unknown[other_unknown['Institution Name'] == inst]['Extracted Call Number'].dropna().unique()[:8]
         for sample in samples:
-            ws_inst.cell(row=row, column=2, value=str(sample)[:60]).font = data_font
-            row += 1
-        row += 1
-    
-    ws_inst.column_dimensions['A'].width = 50
-    ws_inst.column_dimensions['B'].width = 40
-    for col in 'CDEFGHIJKLMNO':
-        ws_inst.column_dimensions[col].width = 10
+            ws_inst.append([None, _cell(ws_inst, str(sample)[:60])])
+        ws_inst.append([])
     
     wb.save(output_path)
 
 
+# Output extensions written by create_columnar_output() instead of Excel
+_COLUMNAR_SUFFIXES = ('.parquet', '.feather')
+
+
+def create_columnar_output(df, output_path):
+    """
+    Write the data-sheet columns as Parquet or Feather, chosen by the file
+    extension, for loading into pandas, R, DuckDB and the like. Needs
+    pyarrow. There is no formatting and no summary sheets, so this is much
+    faster to write than the workbook.
+    """
+    out = df[_OUTPUT_COLUMNS].reset_index(drop=True)
+
+    # IDs as text, as in the workbook. Other columns can mix strings with
+    # numbers read from Excel, which Arrow cannot store in one column.
+    for col in out.columns:
+        if col in ('MMS Id', 'Holdings ID'):
+            out[col] = out[col].astype(str)
+        elif out[col].dtype == object:
+            out[col] = out[col].astype('string')
+
+    if Path(output_path).suffix.lower() == '.parquet':
+        out.to_parquet(output_path, index=False, compression='zstd')
+    else:
+        out.to_feather(output_path)
+
+
 # =============================================================================
 # HTML REPORT
 # =============================================================================
@@ -2018,6 +2290,52 @@ def create_html_report(df, output_path):
 # MAIN
 # =============================================================================
 
+def _first_cell_value(input_path):
+    """
+    Return the value of cell A1 on the first sheet, or None if it is empty.
+
+    Read with openpyxl in read-only mode, which parses only as far as the
+    first row. pd.read_excel(nrows=...) with calamine parses the whole
+    sheet first, so peeking through pandas would read the input twice.
+    openpyxl only opens .xlsx-family files, so anything else (.xls, .ods)
+    is peeked through pandas as before.
+    """
+    try:
+        # data_only returns a formula's cached value, as pandas does
+        wb = load_workbook(input_path, read_only=True, data_only=True)
+    except (InvalidFileException, zipfile.BadZipFile):
+        df_peek = pd.read_excel(input_path, nrows=1, header=None, engine=_EXCEL_READ_ENGINE)
+        if df_peek.empty or pd.isna(df_peek.iloc[0, 0]):
+            return None
+        return df_peek.iloc[0, 0]
+    try:
+        first_row = next(wb.worksheets[0].iter_rows(max_row=1, values_only=True), ())
+    finally:
+        wb.close()
+    return first_row[0] if first_row else None
+
+
+def _escape_control_characters(df):
+    """
+    Put back the _xHHHH_ escapes calamine decodes, so values read as they
+    do with openpyxl.
+
+    Control characters can't appear in worksheet XML, so .xlsx writers
+    store them as _x001F_ and so on. openpyxl leaves those escapes as
+    text; calamine turns them into the raw characters, which openpyxl then
+    refuses to write to the report (IllegalCharacterError) and which the
+    classifier sees differently. Only the characters openpyxl can't write
+    are re-escaped.
+    """
+    for col in df.columns:
+        if df[col].dtype != object and not pd.api.types.is_string_dtype(df[col]):
+            continue
+        if df[col].str.contains(ILLEGAL_CHARACTERS_RE, na=False).any():
+            df[col] = df[col].str.replace(
+                ILLEGAL_CHARACTERS_RE, lambda m: f'_x{ord(m.group()):04X}_', regex=True)
+    return df
+
+
 def main(input_path, output_path):
     """Main processing function."""
 
@@ -2026,22 +2344,25 @@ def main(input_path, output_path):
     # Detect input format: pull script output (headers in row 1) vs
     # Alma Analytics export (3 header rows to skip, 6 columns).
     # Try reading with headers first; fall back to Analytics format.
-    df_peek = pd.read_excel(input_path, nrows=3, header=None)
-    first_cell = str(df_peek.iloc[0, 0]) if not pd.isna(df_peek.iloc[0, 0]) else ''
+    first_cell = _first_cell_value(input_path)
+    first_cell = '' if first_cell is None else str(first_cell)
 
     if first_cell in ('Permanent Call Number', 'MMS Id', '852 MARC',
                        'Holdings ID', 'Institution Name', 'Suppressed'):
         # Pull script output or clean format — headers in row 1
-        df = pd.read_excel(input_path)
+        df = pd.read_excel(input_path, engine=_EXCEL_READ_ENGINE)
     else:
         # Alma Analytics export — skip header rows and assign columns
-        df = pd.read_excel(input_path, skiprows=2, header=None)
+        df = pd.read_excel(input_path, skiprows=2, header=None, engine=_EXCEL_READ_ENGINE)
         df.columns = [
             'Permanent Call Number', 'Permanent Call Number Type', '852 MARC',
             'Normalized Call Number', 'Institution Name', 'MMS Id'
         ]
         df = df.iloc[1:].reset_index(drop=True)
 
+    if _EXCEL_READ_ENGINE == 'calamine':
+        df = _escape_control_characters(df)
+
     # Ensure expected columns exist (fill missing ones with empty strings)
     for col in ['Permanent Call Number', 'Permanent Call Number Type', '852 MARC',
                 'Normalized Call Number', 'Institution Name', 'Library Name',
@@ -2073,89 +2394,87 @@ def main(input_path, output_path):
 
     print(f"Loaded {len(df)} records")
 
-    # Parse 852 MARC and extract call numbers
+    # Parse 852 MARC and extract call numbers. List comprehensions over the
+    # column values throughout, rather than per-row apply(). The parsed
+    # dicts are kept in a plain list rather than a DataFrame column, so they
+    # are freed before the report is written.
     print("Parsing 852 MARC fields...")
-    df['Parsed MARC'] = df['852 MARC'].apply(parse_852_marc)
-    marc_results = df['Parsed MARC'].apply(get_call_number_from_marc)
-    df[['Extracted Call Number', 'From $j', 'J Combined', 'J Conflict']] = pd.DataFrame(
-        marc_results.tolist(), index=df.index
+    parsed_marc = [parse_852_marc(marc) for marc in df['852 MARC']]
+    marc_columns = ['Extracted Call Number', 'From $j', 'J Combined', 'J Conflict']
+    df[marc_columns] = pd.DataFrame(
+        [get_call_number_from_marc(parsed) for parsed in parsed_marc],
+        columns=marc_columns, index=df.index
     )
 
     # Check if the 852 field has any call number subfields ($h, $i, $j)
     def _has_cn_subfields(parsed):
         if not parsed:
             return False
-        sf = parsed.get('subfields', {})
+        sf = parsed['subfields']
         return bool(sf.get('h') or sf.get('i') or sf.get('j'))
 
-    df['Has CN Subfields'] = df['Parsed MARC'].apply(_has_cn_subfields)
+    has_cn_subfields = [_has_cn_subfields(parsed) for parsed in parsed_marc]
 
     # Drop records with no call number subfields ($h, $i, $j).
     # These are holdings with only $a/$b/$c — nothing to analyze.
-    no_cn_count = (~df['Has CN Subfields']).sum()
+    no_cn_count = has_cn_subfields.count(False)
     if no_cn_count:
-        df = df[df['Has CN Subfields']].reset_index(drop=True)
+        df = df[has_cn_subfields].reset_index(drop=True)
+        parsed_marc = [parsed for parsed, keep in zip(parsed_marc, has_cn_subfields) if keep]
         print(f"  Excluded {no_cn_count} records with no call number subfields")
 
-    df['Call Number for Analysis'] = df.apply(
-        lambda row: row['Extracted Call Number'] if row['Extracted Call Number'] else row['Permanent Call Number'],
-        axis=1
-    )
+    call_numbers = [
+        extracted if extracted else permanent
+        for extracted, permanent in zip(df['Extracted Call Number'], df['Permanent Call Number'])
+    ]
 
     # Extract current indicator from parsed MARC
     # Use 'blank' for empty/missing indicators so they display clearly
-    df['Current Indicator'] = df['Parsed MARC'].apply(
-        lambda x: x.get('indicator1', '') if x else '').apply(
-        lambda v: v if v else 'blank')
+    df['Current Indicator'] = [
+        (parsed.get('indicator1', '') if parsed else '') or 'blank'
+        for parsed in parsed_marc
+    ]
 
-    # Classify each call number
+    # Classify each call number. Pull the input columns out once and zip
+    # them, rather than boxing every row into a Series with iterrows().
+    # Catalogs repeat the same values thousands of times (AV labels,
+    # prefixes, serial call numbers), so each distinct combination of
+    # inputs is classified once and the result is shared by every row.
+    # The institution doesn't affect the result, so it is left out of the
+    # key and a call number shared across campuses is classified once.
+    # Large catalogs spread the distinct keys over all cores.
     print("Classifying call numbers...")
-    indicators = []
-    class_types = []
-    confidences = []
-    notes = []
-    subfield_changes = []
+    keys = list(zip(call_numbers, df['From $j'], df['J Combined'], df['J Conflict']))
+    distinct_keys = list(dict.fromkeys(keys))
+    unique_results = dict(zip(distinct_keys, _categorize_keys(distinct_keys)))
+    results = [unique_results[key] for key in keys]
+    print(f"  {len(unique_results)} distinct call numbers")
+    result_columns = ['Suggested Indicator', 'Classification Type', 'Confidence',
+                      'Notes', 'Subfield Changes']
+    df[result_columns] = pd.DataFrame(results, columns=result_columns, index=df.index)
+
+    # Check for trailing period on $h (misplaced cutter period)
+    period_note = 'Move period from end of $h to start of $i'
+    period_mask = [
+        bool(parsed) and parsed['subfields'].get('h', '').endswith('.')
+        and bool(parsed['subfields'].get('i', ''))
+        for parsed in parsed_marc
+    ]
+    if any(period_mask):
+        changes = df.loc[period_mask, 'Subfield Changes']
+        df.loc[period_mask, 'Subfield Changes'] = (
+            (changes + '; ').where(changes != '', '') + period_note
+        )
 
-    for _, row in df.iterrows():
-        cn = row['Call Number for Analysis']
-        from_j = row['From $j']
-        j_combined = row['J Combined']
-        j_conflict = row['J Conflict']
-        institution = row.get('Institution Name')
-        result = categorize_call_number(cn, from_j=from_j, j_combined=j_combined,
-                                        j_conflict=j_conflict, institution=institution)
-        indicators.append(result[0])
-        class_types.append(result[1])
-        confidences.append(result[2])
-        notes.append(result[3])
-
-        # Check for trailing period on $h (misplaced cutter period)
-        sf_changes = result[4]
-        parsed = row.get('Parsed MARC')
-        if parsed:
-            sf = parsed.get('subfields', {})
-            raw_h = sf.get('h', '')
-            if raw_h.endswith('.') and sf.get('i', ''):
-                period_note = 'Move period from end of $h to start of $i'
-                if sf_changes:
-                    sf_changes = sf_changes + '; ' + period_note
-                else:
-                    sf_changes = period_note
-        subfield_changes.append(sf_changes)
-
-    df['Suggested Indicator'] = indicators
-    df['Classification Type'] = class_types
-    df['Confidence'] = confidences
-    df['Notes'] = notes
-    df['Subfield Changes'] = subfield_changes
+    # The per-row working lists aren't needed for the report
+    del parsed_marc, call_numbers, keys, results, period_mask
 
     # Compare current vs suggested indicator
-    df['Change Needed'] = df.apply(
-        lambda row: 'Yes' if row['Current Indicator'] != row['Suggested Indicator']
-                          and row['Suggested Indicator'] not in ['blank', 'N/A']
-                     else ('Review' if row['Suggested Indicator'] in ['N/A']
-                           else 'No'),
-        axis=1)
+    df['Change Needed'] = [
+        'Review' if suggested == 'N/A'
+        else ('Yes' if suggested != current and suggested != 'blank' else 'No')
+        for current, suggested in zip(df['Current Indicator'], df['Suggested Indicator'])
+    ]
 
     # Print summary
     print("\nClassification Summary:")
@@ -2164,11 +2483,15 @@ def main(input_path, output_path):
     summary = summary.sort_values('Count', ascending=False)
     print(summary.to_string(index=False))
     
-    # Create Excel output
+    # Create the output file: Parquet or Feather when the output name asks
+    # for it, otherwise the formatted Excel workbook
     print(f"\nSaving to {output_path}...")
-    create_excel_output(df, output_path)
+    if Path(output_path).suffix.lower() in _COLUMNAR_SUFFIXES:
+        create_columnar_output(df, output_path)
+    else:
+        create_excel_output(df, output_path)
 
-    # Create interactive HTML report alongside the Excel file
+    # Create interactive HTML report alongside the output file
     html_path = str(Path(output_path).with_suffix('.html'))
     print(f"Saving HTML report to {html_path}...")
     create_html_report(df, html_path)
@@ -17,14 +17,35 @@ Requires: .env in the project root with IZ API keys.
 """
 
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 import pandas as pd
 from pathlib import Path
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+# Optional: PyExcelerate writes the sheet several times faster than
+# openpyxl, which needs a Python call per cell. XlsxWriter is the next
+# choice; it is a little slower than PyExcelerate but still well ahead of
+# openpyxl. save_to_excel falls back to openpyxl when neither is installed.
+try:
+    import pyexcelerate
+except ImportError:
+    pyexcelerate = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 # Project root (one level up from src/)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -78,8 +99,46 @@ ANALYTICS_TO_SCRIPT_COLUMNS = {
 }
 
 
+# Output columns with a handful of distinct values (one institution per
+# report, a few libraries, Yes/No). Their values are interned as rows are
+# read, so every row shares one string object per distinct value.
+LOW_CARDINALITY_COLUMNS = {
+    'Institution Name', 'Library Name', 'Permanent Call Number Type', 'Suppressed',
+}
+
+# Schools are pulled in parallel (each with its own API key), at most this
+# many at once. Each pull spends nearly all its time waiting on the API.
+MAX_PARALLEL_SCHOOLS = 8
+
+# (connect, read) timeouts in seconds for each Analytics request. The
+# first page can take a while, since Analytics runs the report before
+# answering.
+REQUEST_TIMEOUT = (10, 300)
+
+_print_lock = threading.Lock()
+
+# Set by main() when one school's pull fails, so the other pulls stop at
+# their next page instead of running on for minutes.
+_stop_pulls = threading.Event()
+
+
+class AnalyticsError(Exception):
+    """An Analytics request failed, or returned something unusable."""
+
+
+def _log(message=''):
+    """Print a whole line; safe when several schools are pulled at once."""
+    with _print_lock:
+        print(message, flush=True)
+
+
 def load_env(env_path):
-    """Load key=value pairs from an env file."""
+    """
+    Load key=value pairs from an env file.
+
+    Values may be wrapped in single or double quotes (KEY="value"), as
+    python-dotenv and shells allow; the quotes are not part of the value.
+    """
     config = {}
     if not env_path.exists():
         return config
@@ -90,7 +149,10 @@ def load_env(env_path):
                 continue
             if '=' in line:
                 key, value = line.split('=', 1)
-                config[key.strip()] = value.strip()
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+                config[key.strip()] = value
     return config
 
 
@@ -103,20 +165,58 @@ def get_api_key(config, school_code):
     return key if key else None
 
 
-def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
+def make_session():
+    """
+    Create a requests.Session for one school's pull.
+
+    The session keeps its connection open from page to page instead of
+    opening a new connection (and TLS handshake) for every request.
+
+    Only failures where Alma never acted on the request are retried (up
+    to 3 times, with backoff): connection errors before the request was
+    sent, and 429 rate-limit responses. The resumption token is a cursor
+    on Alma's side, so a page request that reached the server may have
+    moved it on already; resending it after a read timeout or 5xx could
+    silently skip or repeat a page. If the retries run out, the last
+    response is returned, so the caller's HTTP error handling still
+    applies.
+    """
+    retry = Retry(total=3, connect=3, read=0, other=0, status=3,
+                  status_forcelist=[429], backoff_factor=0.5,
+                  allowed_methods=['GET'], raise_on_status=False)
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    session.mount('http://', HTTPAdapter(max_retries=retry))
+    return session
+
+
+def fetch_analytics_report(base_url, api_key, report_path, limit=1000, label='',
+                           session=None):
     """
     Fetch an Alma Analytics report with pagination.
 
     Returns a list of dicts, one per row, with column names as keys.
+    Progress lines are prefixed with label (e.g. "[KB] ") so pulls that
+    run side by side can be told apart. Pass a session from
+    make_session() to reuse one connection for every page.
+
+    Raises AnalyticsError if a page can't be fetched, or if another
+    school's pull has failed in the meantime.
     """
+    http = session if session is not None else requests
     url = f"{base_url}/almaws/v1/analytics/reports"
     all_rows = []
     column_names = None
+    wanted_columns = None
+    interned_columns = set()
+    tag_info = {}
     token = None
     page = 0
 
     while True:
         page += 1
+        if _stop_pulls.is_set():
+            raise AnalyticsError(f"stopped at page {page}: another pull failed")
         params = {
             'apikey': api_key,
             'limit': limit,
@@ -128,15 +228,21 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
         else:
             params['path'] = report_path
 
-        print(f"  Fetching page {page}...", end=' ', flush=True)
-        response = requests.get(url, params=params)
+        progress = f"  {label}Fetching page {page}..."
+        response = http.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True)
 
         if response.status_code != 200:
-            print(f"ERROR (HTTP {response.status_code})")
-            print(f"  Response: {response.text[:500]}")
-            sys.exit(1)
-
-        root = ET.fromstring(response.text)
+            _log(f"{progress} ERROR (HTTP {response.status_code})")
+            _log(f"  {label}Response: {response.text[:500]}")
+            raise AnalyticsError(f"HTTP {response.status_code} on page {page}")
+
+        # Feed the body to the parser as it arrives, so the page is parsed
+        # while it downloads and never held as one big bytes object. Raw
+        # bytes, not text: the XML declares its own encoding.
+        parser = ET.XMLParser()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            parser.feed(chunk)
+        root = parser.close()
 
         # Check if finished
         is_finished_el = root.find('.//IsFinished')
@@ -145,9 +251,9 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
         # Find the result XML — it may be nested inside a namespace
         result_xml = root.find('.//ResultXml')
         if result_xml is None:
-            print("ERROR: No ResultXml in response")
-            print(f"  Response: {response.text[:500]}")
-            sys.exit(1)
+            _log(f"{progress} ERROR: No ResultXml in response")
+            _log(f"  {label}Response: {ET.tostring(root, encoding='unicode')[:500]}")
+            raise AnalyticsError(f"no ResultXml on page {page}")
 
         # The actual data is inside a rowset element (may have namespace)
         # Find all elements regardless of namespace
@@ -160,6 +266,11 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
         if rowset is None:
             # Try without namespace
             rowset = result_xml
+            row_candidates = result_xml.iter()
+        else:
+            # Rows are direct children of the rowset, so there's no need to
+            # visit every Column element beneath them
+            row_candidates = rowset
 
         # Extract column names from the first page
         if column_names is None:
@@ -168,28 +279,47 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
             # or we extract them from the xsd:schema
             column_names = _extract_column_names(root)
             if column_names:
-                print(f"({len(column_names)} columns)", end=' ')
+                progress += f" ({len(column_names)} columns)"
+                # Only store the values rows_to_dataframe will keep; the
+                # dummy "Column 0" and any extra report columns are skipped
+                matched = _match_columns(column_names)
+                wanted_columns = {idx for idx, _ in matched}
+                interned_columns = {idx for idx, name in matched
+                                    if name in LOW_CARDINALITY_COLUMNS}
+                tag_info = {}
 
         # Extract rows. Column elements have tags like "Column0", "Column5",
         # etc. When a column is empty, Analytics may skip it entirely, so we
         # must parse the column index from the tag and place each value at
-        # the correct position (not just append in order).
+        # the correct position (not just append in order). A report only
+        # has a handful of distinct tags, so each is parsed once and the
+        # result looked up for every later Column element.
         rows_found = 0
-        for row_elem in rowset.iter():
+        for row_elem in row_candidates:
             if 'Row' in row_elem.tag and row_elem.tag != rowset.tag:
                 indexed_values = {}
+                has_columns = False
                 for col_elem in row_elem:
-                    # Tag might be namespaced: {ns}Column5 → extract "5"
-                    tag = col_elem.tag.split('}')[-1] if '}' in col_elem.tag else col_elem.tag
-                    # Extract the column number from the tag (e.g., "Column5" → 5)
-                    col_num = ''.join(c for c in tag if c.isdigit())
-                    if col_num:
-                        indexed_values[int(col_num)] = col_elem.text if col_elem.text else ''
-                if indexed_values:
+                    tag = col_elem.tag
+                    try:
+                        col_info = tag_info[tag]
+                    except KeyError:
+                        col_info = tag_info[tag] = _column_tag_info(
+                            tag, wanted_columns, interned_columns)
+                    if col_info is None:
+                        continue
+                    has_columns = True
+                    col_idx, intern_value = col_info
+                    if col_idx is not None:
+                        value = col_elem.text if col_elem.text else ''
+                        if intern_value:
+                            value = sys.intern(value)
+                        indexed_values[col_idx] = value
+                if has_columns:
                     all_rows.append(indexed_values)
                     rows_found += 1
 
-        print(f"{rows_found} rows")
+        _log(f"{progress} {rows_found} rows")
 
         if is_finished:
             break
@@ -197,7 +327,7 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
         # Get resumption token
         token_el = root.find('.//ResumptionToken')
         if token_el is None or not token_el.text:
-            print("  Warning: No resumption token but IsFinished is false. Stopping.")
+            _log(f"  {label}Warning: No resumption token but IsFinished is false. Stopping.")
             break
         token = token_el.text
 
@@ -207,6 +337,26 @@ def fetch_analytics_report(base_url, api_key, report_path, limit=1000):
     return column_names, all_rows
 
 
+def _column_tag_info(tag, wanted_columns, interned_columns):
+    """
+    Work out what to do with a Column element from its tag.
+
+    Returns None if the tag has no column number (not a data column),
+    otherwise (col_idx, intern_value); col_idx is None for columns
+    rows_to_dataframe won't keep, so their values can be skipped.
+    """
+    # Tag might be namespaced: {ns}Column5 → extract "5"
+    tag = tag.split('}')[-1] if '}' in tag else tag
+    # Extract the column number from the tag (e.g., "Column5" → 5)
+    col_num = ''.join(c for c in tag if c.isdigit())
+    if not col_num:
+        return None
+    col_idx = int(col_num)
+    if wanted_columns is not None and col_idx not in wanted_columns:
+        return (None, False)
+    return (col_idx, col_idx in interned_columns)
+
+
 def _extract_column_names(root):
     """
     Extract column names from the Analytics API response.
@@ -222,9 +372,15 @@ def _extract_column_names(root):
     """
     indexed_names = {}
 
+    # The headings live in the xsd:schema at the top of the rowset. Search
+    # only that subtree rather than every element of every data row.
+    schema = root.find('.//{*}schema')
+    if schema is None:
+        schema = root
+
     # Look for columnHeading attributes in the schema, paired with the
     # Column index from the element's 'name' attribute (e.g., "Column5").
-    for elem in root.iter():
+    for elem in schema.iter():
         heading = elem.attrib.get('{urn:saw-sql}columnHeading')
         if not heading:
             for attr_name, attr_val in elem.attrib.items():
@@ -241,24 +397,12 @@ def _extract_column_names(root):
     return indexed_names if indexed_names else None
 
 
-def rows_to_dataframe(column_names_map, rows):
+def _match_columns(column_names_map):
     """
-    Convert raw Analytics rows to a DataFrame with the columns the
-    analysis script expects.
-
-    column_names_map is a dict mapping column index → heading name
-    (from the schema), e.g. {0: 'Column 0', 5: 'MMS Id', ...}.
-    Each row is also a dict mapping column index → value (from the
-    XML parsing). Both are matched by index so column order and
-    missing columns don't matter.
+    Build a list of (index, script_name) for columns we want to keep —
+    i.e., columns whose Analytics heading matches something in
+    ANALYTICS_TO_SCRIPT_COLUMNS — in column index order.
     """
-    if not column_names_map or not rows:
-        print("  Warning: No column names or no data rows.")
-        return pd.DataFrame()
-
-    # Build a list of (index, analytics_name, script_name) for columns
-    # we want to keep — i.e., columns whose Analytics heading matches
-    # something in ANALYTICS_TO_SCRIPT_COLUMNS.
     keep_columns = []
     for idx, heading in sorted(column_names_map.items()):
         # Try exact match first
@@ -270,27 +414,56 @@ def rows_to_dataframe(column_names_map, rows):
             if analytics_name in heading:
                 keep_columns.append((idx, script_name))
                 break
+    return keep_columns
 
-    if not keep_columns:
-        print("  Warning: No matching columns found in Analytics response.")
+
+def rows_to_dataframe(column_names_map, rows):
+    """
+    Convert raw Analytics rows to a DataFrame with the columns the
+    analysis script expects.
+
+    column_names_map is a dict mapping column index → heading name
+    (from the schema), e.g. {0: 'Column 0', 5: 'MMS Id', ...}.
+    Each row is also a dict mapping column index → value (from the
+    XML parsing). Both are matched by index so column order and
+    missing columns don't matter.
+    """
+    if not column_names_map or not rows:
+        _log("  Warning: No column names or no data rows.")
         return pd.DataFrame()
 
-    # Build the DataFrame by pulling the correct index from each row.
-    data = []
-    for row in rows:
-        data.append([row.get(idx, '') for idx, _ in keep_columns])
+    keep_columns = _match_columns(column_names_map)
+    if not keep_columns:
+        _log("  Warning: No matching columns found in Analytics response.")
+        return pd.DataFrame()
 
-    col_names = [name for _, name in keep_columns]
-    df = pd.DataFrame(data, columns=col_names)
+    # Build the DataFrame one column at a time by pulling the correct index
+    # from each row. pandas takes whole columns directly, where a list of
+    # row lists would have to be transposed into columns first. Keyed by
+    # position, so two headings mapped to the same name stay separate.
+    data = {pos: [row.get(idx, '') for row in rows]
+            for pos, (idx, _) in enumerate(keep_columns)}
+    df = pd.DataFrame(data)
+    df.columns = [name for _, name in keep_columns]
 
     return df
 
 
 def save_to_excel(df, output_path):
-    """Save DataFrame to Excel with 12pt Arial formatting."""
-    data_font = Font(name='Arial', size=12)
-    header_font = Font(name='Arial', size=12, bold=True)
-
+    """
+    Save DataFrame to Excel with 12pt Arial formatting.
+
+    Written with PyExcelerate or XlsxWriter when one is installed,
+    otherwise openpyxl. The three give the same values, fonts and formats
+    for non-empty cells, with these differences:
+    - PyExcelerate leaves empty cells out, so a blank cell reads back as
+      Calibri 11 / General rather than Arial 12 (and '@' for IDs); it
+      still displays with its column's style in Excel.
+    - XlsxWriter adds its usual 0.71 characters of padding to column
+      widths.
+    - XlsxWriter writes values starting with '=' as text; openpyxl and
+      PyExcelerate write them as formulas.
+    """
     # Force ID columns to string so Excel doesn't convert them to
     # scientific notation (which loses digits on long numbers).
     id_columns = {'MMS Id', 'Holdings ID'}
@@ -298,33 +471,158 @@ def save_to_excel(df, output_path):
         if col in df.columns:
             df[col] = df[col].astype(str)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Analytics Data"
+    if pyexcelerate is not None:
+        _save_with_pyexcelerate(df, output_path, id_columns)
+        return
+    if xlsxwriter is not None:
+        _save_with_xlsxwriter(df, output_path, id_columns)
+        return
 
-    # Write headers
+    data_font = Font(name='Arial', size=12)
+    header_font = Font(name='Arial', size=12, bold=True)
+
+    # Write-only mode streams rows to disk as they are appended instead of
+    # holding every cell in memory. Column widths must be set before the
+    # first row is written.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Analytics Data")
+
+    # Auto-width columns
     for col_idx, col_name in enumerate(df.columns, 1):
-        cell = ws.cell(row=1, column=col_idx, value=col_name)
+        ws.column_dimensions[get_column_letter(col_idx)].width = max(15, len(str(col_name)) + 5)
+
+    # Write headers
+    header_cells = []
+    for col_name in df.columns:
+        cell = WriteOnlyCell(ws, value=col_name)
         cell.font = header_font
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    # Resolve each column's style once. Assigning a Font to a cell makes
+    # openpyxl look it up in the workbook's style tables every time; the
+    # resolved style is a small array of table indexes that can be copied.
+    # cell._style is an openpyxl internal, not public API, which is why the
+    # README pins openpyxl to 3.1.x.
+    # IDs are stored as explicit text to prevent scientific notation.
+    data_template = WriteOnlyCell(ws)
+    data_template.font = data_font
+    id_template = WriteOnlyCell(ws)
+    id_template.font = data_font
+    id_template.number_format = '@'
+    data_style, id_style = data_template._style, id_template._style
+    column_styles = [id_style if col_name in id_columns else data_style
+                     for col_name in df.columns]
+
+    # Write data. itertuples() yields plain tuples, where iterrows() would
+    # build a Series for every row.
+    for row in df.itertuples(index=False, name=None):
+        row_cells = []
+        for value, style in zip(row, column_styles):
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(style)
+            row_cells.append(cell)
+        ws.append(row_cells)
 
-    # Write data
-    for row_idx, row in df.iterrows():
-        for col_idx, value in enumerate(row, 1):
-            col_name = df.columns[col_idx - 1]
-            cell = ws.cell(row=row_idx + 2, column=col_idx, value=value)
-            cell.font = data_font
-            # Store IDs as explicit text to prevent scientific notation
-            if col_name in id_columns:
-                cell.number_format = '@'
+    wb.save(output_path)
 
-    # Auto-width columns
+
+def _save_with_pyexcelerate(df, output_path, id_columns):
+    """
+    PyExcelerate version of save_to_excel. The whole grid goes to
+    new_sheet() in one call, and styles are set per column and for the
+    header row rather than cell by cell.
+    """
+    data_font = pyexcelerate.Font(family='Arial', size=12)
+    header_style = pyexcelerate.Style(
+        font=pyexcelerate.Font(family='Arial', size=12, bold=True))
+
+    wb = pyexcelerate.Workbook()
+    # Empty strings become None, which PyExcelerate leaves out entirely
+    # (openpyxl writes a styled empty cell)
+    rows = [[value if value != '' else None for value in row] for row in df.values.tolist()]
+    ws = wb.new_sheet("Analytics Data", data=[list(df.columns)] + rows)
+
+    # Auto-width columns. IDs are stored as explicit text to prevent
+    # scientific notation.
     for col_idx, col_name in enumerate(df.columns, 1):
-        col_letter = chr(64 + col_idx) if col_idx <= 26 else 'A'
-        ws.column_dimensions[col_letter].width = max(15, len(str(col_name)) + 5)
+        ws.set_col_style(col_idx, pyexcelerate.Style(
+            font=data_font,
+            format=pyexcelerate.Format('@') if col_name in id_columns else None,
+            size=max(15, len(str(col_name)) + 5),
+        ))
+
+    ws.set_row_style(1, header_style)
 
     wb.save(output_path)
 
 
+def _save_with_xlsxwriter(df, output_path, id_columns):
+    """
+    XlsxWriter version of save_to_excel. constant_memory mode writes each
+    row to a temporary file once the next row starts, so memory stays flat
+    however long the report is.
+    """
+    wb = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    ws = wb.add_worksheet("Analytics Data")
+
+    header_format = wb.add_format({'font_name': 'Arial', 'font_size': 12, 'bold': True})
+    data_format = wb.add_format({'font_name': 'Arial', 'font_size': 12})
+    # IDs are stored as explicit text to prevent scientific notation
+    id_format = wb.add_format({'font_name': 'Arial', 'font_size': 12, 'num_format': '@'})
+    column_formats = [id_format if col_name in id_columns else data_format
+                      for col_name in df.columns]
+
+    # Auto-width columns
+    for col_idx, col_name in enumerate(df.columns):
+        ws.set_column(col_idx, col_idx, max(15, len(str(col_name)) + 5))
+
+    ws.write_row(0, 0, list(df.columns), header_format)
+
+    # write_row() takes a single format, so cells are written one at a time
+    # to give ID columns their text format. Empty strings become blank
+    # cells that keep their format, as openpyxl writes them.
+    write_string, write_blank = ws.write_string, ws.write_blank
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), 1):
+        for col_idx, (value, cell_format) in enumerate(zip(row, column_formats)):
+            if value == '':
+                write_blank(row_idx, col_idx, None, cell_format)
+            else:
+                write_string(row_idx, col_idx, value, cell_format)
+
+    wb.close()
+
+
+def pull_school(code, config, base_url, data_dir):
+    """Pull one school's report and save it to data_dir. Returns the output path."""
+    api_key = get_api_key(config, code)
+    report_path = REPORT_PATHS[code]
+    label = f"[{code}] "
+
+    _log(f"\n{'='*60}\nPulling data for {code}\nReport: {report_path}\n{'='*60}")
+
+    with make_session() as session:
+        column_names, rows = fetch_analytics_report(
+            base_url, api_key, report_path, label=label, session=session)
+
+    if not rows:
+        _log(f"  No data returned for {code}.")
+        return None
+
+    _log(f"\n  {label}Total rows: {len(rows)}")
+
+    # Convert to DataFrame
+    df = rows_to_dataframe(column_names, rows)
+    _log(f"  {label}Columns: {list(df.columns)}")
+
+    # Save
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_path = data_dir / f"{code}_852_data_{timestamp}.xlsx"
+    save_to_excel(df, output_path)
+    _log(f"  {label}Saved to: {output_path}")
+    return output_path
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python pull_852_analytics.py <school_code> [school_code ...]")
@@ -371,32 +669,48 @@ def main():
     data_dir = PROJECT_ROOT / 'data'
     data_dir.mkdir(exist_ok=True)
 
-    for code in schools:
-        api_key = get_api_key(config, code)
-        report_path = REPORT_PATHS[code]
-
-        print(f"\n{'='*60}")
-        print(f"Pulling data for {code}")
-        print(f"Report: {report_path}")
-        print(f"{'='*60}")
-
-        column_names, rows = fetch_analytics_report(base_url, api_key, report_path)
-
-        if not rows:
-            print(f"  No data returned for {code}.")
-            continue
-
-        print(f"\n  Total rows: {len(rows)}")
-
-        # Convert to DataFrame
-        df = rows_to_dataframe(column_names, rows)
-        print(f"  Columns: {list(df.columns)}")
-
-        # Save
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_path = data_dir / f"{code}_852_data_{timestamp}.xlsx"
-        save_to_excel(df, output_path)
-        print(f"  Saved to: {output_path}")
+    # Failures that end one school's pull: Analytics errors, connection
+    # errors and timeouts once retries run out, and malformed XML
+    pull_errors = (AnalyticsError, requests.RequestException, ET.ParseError)
+    failures = []
+    not_started = []
+
+    if len(schools) == 1:
+        try:
+            pull_school(schools[0], config, base_url, data_dir)
+        except pull_errors as e:
+            failures.append((schools[0], e))
+    else:
+        # Pull schools side by side. Each one pages through its own report
+        # in order, since every page needs the previous page's token. The
+        # first failure cancels the pulls that haven't started and stops
+        # the running ones at their next page. Cancelled futures are
+        # dropped from pending by hand: wait() is never told about them.
+        workers = min(MAX_PARALLEL_SCHOOLS, len(schools))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(pull_school, code, config, base_url, data_dir): code
+                       for code in schools}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        future.result()
+                    except pull_errors as e:
+                        failures.append((futures[future], e))
+                        if not _stop_pulls.is_set():
+                            _stop_pulls.set()
+                            cancelled = {f for f in pending if f.cancel()}
+                            not_started.extend(futures[f] for f in futures if f in cancelled)
+                            pending -= cancelled
+
+    if failures:
+        print()
+        for code, error in failures:
+            print(f"Error: pull for {code} failed: {error}")
+        if not_started:
+            print(f"Not pulled: {', '.join(not_started)}")
+        sys.exit(1)
 
     print("\nDone!")
 
@@ -0,0 +1,94 @@
+"""
+Golden-output check for the call number classifier and 852 parser.
+
+golden_852.json holds a few hundred call numbers and 852 fields with the
+results the original, pattern-by-pattern classifier gave for them: at
+least one call number for every distinct outcome seen over a 28k-value
+test corpus, plus Unicode and control-character edge cases. Any change
+to the classifier's rules or their optimizations should leave these
+results unchanged.
+
+Run from the project root:
+    python -m unittest discover tests
+    ANALYZE_852_NO_PCRE2=1 python -m unittest discover tests   # re only
+
+After an intentional change in behavior, rewrite the expected results
+(same inputs) and review the diff:
+    python tests/test_golden_852.py --update
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import analyze_852_indicators as analyze  # noqa: E402
+
+GOLDEN_PATH = Path(__file__).parent / 'golden_852.json'
+
+
+def _call_number_results(cn, flags):
+    """The results recorded for one call number, as JSON would load them."""
+    return json.loads(json.dumps({
+        'call_number': cn,
+        'categorize': [analyze.categorize_call_number(cn, *f) for f in flags],
+        'not_a_call_number': analyze.is_not_a_call_number(cn),
+        'strip_shelving_prefix': analyze.strip_shelving_prefix(cn),
+    }))
+
+
+def _marc_results(marc):
+    """The results recorded for one 852 field, as JSON would load them."""
+    parsed = analyze.parse_852_marc(marc)
+    return json.loads(json.dumps({
+        'marc': marc,
+        'parsed': parsed,
+        'call_number': analyze.get_call_number_from_marc(parsed),
+    }))
+
+
+class GoldenOutputTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(GOLDEN_PATH, encoding='utf-8') as f:
+            cls.golden = json.load(f)
+
+    def test_call_numbers(self):
+        flags = self.golden['flags']
+        for expected in self.golden['call_numbers']:
+            with self.subTest(call_number=expected['call_number']):
+                self.assertEqual(_call_number_results(expected['call_number'], flags), expected)
+
+    def test_852_fields(self):
+        for expected in self.golden['marc']:
+            with self.subTest(marc=expected['marc']):
+                self.assertEqual(_marc_results(expected['marc']), expected)
+
+
+def update_golden():
+    """Rewrite golden_852.json with the current results for the same inputs."""
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        golden = json.load(f)
+    flags = golden['flags']
+    call_numbers = [_call_number_results(case['call_number'], flags)
+                    for case in golden['call_numbers']]
+    marc = [_marc_results(case['marc']) for case in golden['marc']]
+
+    # One case per line keeps the diff readable after an update
+    with open(GOLDEN_PATH, 'w', encoding='utf-8') as f:
+        f.write('{\n"flags": ' + json.dumps(flags) + ',\n"call_numbers": [\n')
+        f.write(',\n'.join(json.dumps(case) for case in call_numbers))
+        f.write('\n],\n"marc": [\n')
+        f.write(',\n'.join(json.dumps(case) for case in marc))
+        f.write('\n]\n}\n')
+    print(f"Updated {GOLDEN_PATH}")
+
+
+if __name__ == '__main__':
+    if '--update' in sys.argv:
+        update_golden()
+    else:
+        unittest.main()
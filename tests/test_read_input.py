@@ -0,0 +1,61 @@
+"""
+End-to-end check that an input workbook reads the same with either Excel
+reader (python-calamine when installed, otherwise openpyxl).
+
+.xlsx files store control characters as _xHHHH_ escapes. openpyxl leaves
+the escape as text, while calamine decodes it; main() must re-escape so
+the report can still be written and the value is classified as before.
+
+Run from the project root:
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import analyze_852_indicators as analyze  # noqa: E402
+
+# Stored in the file as written; openpyxl doesn't escape underscores, so the
+# cell holds exactly what Excel writes for 'ask\x1f at desk'
+ESCAPED_CALL_NUMBER = 'ask_x001F_ at desk'
+
+
+class ControlCharacterInputTest(unittest.TestCase):
+
+    def test_escaped_control_character(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / 'input.xlsx'
+            output_path = Path(tmp) / 'output.xlsx'
+
+            wb = Workbook()
+            ws = wb.active
+            ws.append(['Permanent Call Number', '852 MARC', 'MMS Id'])
+            ws.append([ESCAPED_CALL_NUMBER, f'852_0 $$h {ESCAPED_CALL_NUMBER}', '991'])
+            ws.append(['QA76.73 .P98', '852_0 $$h QA76.73 $$i .P98', '992'])
+            wb.save(input_path)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyze.main(str(input_path), str(output_path))
+
+            rows = load_workbook(output_path, read_only=True).worksheets[0].iter_rows(values_only=True)
+            header = next(rows)
+            records = {row[header.index('MMS Id')]: row for row in rows}
+
+        row = records['991']
+        indicator, scheme, confidence, note, _ = analyze.categorize_call_number(ESCAPED_CALL_NUMBER)
+        self.assertEqual(row[header.index('Extracted Call Number')], ESCAPED_CALL_NUMBER)
+        self.assertEqual(row[header.index('Suggested Indicator')], indicator)
+        self.assertEqual(row[header.index('Classification Type')], scheme)
+        self.assertEqual(row[header.index('Confidence')], confidence)
+
+
+if __name__ == '__main__':
+    unittest.main()